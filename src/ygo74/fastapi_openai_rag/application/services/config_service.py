@@ -15,7 +15,7 @@ class ConfigService:
 
     _instance: Optional['ConfigService'] = None
     _config: Optional[AppConfig] = None
-    _config_file_path: str = "config.json"
+    _config_file_path: str = os.getenv("CONFIG_FILE", "config.json")
     _last_modified: Optional[float] = None
 
     def __new__(cls) -> 'ConfigService':
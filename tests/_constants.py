@@ -0,0 +1,5 @@
+"""Constants shared by the test modules."""
+from datetime import datetime, timezone
+
+# Fixed timestamp shared by every test entity; no test asserts on it
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
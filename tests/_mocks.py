@@ -0,0 +1,148 @@
+"""Mock SQLAlchemy objects shared by the repository tests."""
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+from sqlalchemy.exc import NoResultFound
+
+
+class MockQuery:
+    """Mock SQLAlchemy query for testing."""
+
+    def __init__(self, result: List[Any]) -> None:
+        self.result: List[Any] = result
+
+    def filter(self, *args: Any) -> 'MockQuery':
+        """Mock filter method."""
+        return self
+
+    def first(self) -> Optional[Any]:
+        """Mock first method."""
+        return self.result[0] if self.result else None
+
+    def get(self, id: int) -> Optional[Any]:
+        """Mock get method."""
+        return self.result[0] if self.result else None
+
+    def all(self) -> List[Any]:
+        """Mock all method."""
+        return self.result
+
+    def one(self) -> Any:
+        """Mock one method."""
+        if self.result:
+            return self.result[0]
+        raise NoResultFound()
+
+
+class MockSession:
+    """Mock SQLAlchemy session for testing."""
+
+    def __init__(self) -> None:
+        """Initialize mock session."""
+        self.query_result: List[Any] = []
+        self.added_items: List[Any] = []
+        self.merged_items: List[Any] = []
+        self.deleted: bool = False
+        self.execute_result: Any = MagicMock()
+        self.committed: bool = False
+        self.get_result: Optional[Any] = None
+
+        # Create a mock query object
+        self.query = MagicMock()
+
+    def set_query_result(self, result: List[Any]) -> None:
+        """Set result for query method.
+
+        Args:
+            result: Result to return from query
+        """
+        # Ensure we have a proper MagicMock for query
+        self.query = MagicMock()
+        self.query.all.return_value = result
+        self.query.first.return_value = result[0] if result else None
+        self.query.filter.return_value = self.query
+        self.query.filter_by.return_value = self.query
+        self.query.options.return_value = self.query
+        self.query.join.return_value = self.query
+        self.query.where.return_value = self.query
+
+        # Add method to handle get with ID
+        self.query.get.side_effect = lambda id: next((item for item in result if item.id == id), None)
+
+    def set_execute_result(self, result: MagicMock) -> None:
+        """Set result for execute method.
+
+        Args:
+            result: Mock result to return from execute
+        """
+        self.execute_result = result
+
+    def add(self, item):
+        """Mock add method.
+
+        Args:
+            item: Item to add
+        """
+        self.added_items.append(item)
+        # Set ID if not already set
+        if not hasattr(item, 'id') or item.id is None:
+            item.id = len(self.added_items)
+
+    def merge(self, item):
+        """Mock merge method.
+
+        Args:
+            item: Item to merge
+        """
+        self.merged_items.append(item)
+        return item
+
+    def delete(self, item):
+        """Mock delete method.
+
+        Args:
+            item: Item to delete
+        """
+        self.deleted = True
+
+    def commit(self):
+        """Mock commit method."""
+        self.committed = True
+
+    def rollback(self):
+        """Mock rollback method."""
+        pass
+
+    def flush(self):
+        """Mock flush method."""
+        pass
+
+    def refresh(self, item):
+        """Mock refresh method.
+
+        Args:
+            item: Item to refresh
+        """
+        pass
+
+    def execute(self, stmt):
+        """Mock execute method.
+
+        Args:
+            stmt: Statement to execute
+
+        Returns:
+            Mock result
+        """
+        return self.execute_result
+
+    def get(self, model_class, entity_id):
+        """Mock get method.
+
+        Args:
+            model_class: Model class to get
+            entity_id: Entity ID to get
+
+        Returns:
+            Entity if found, None otherwise
+        """
+        return self.get_result
@@ -1,7 +1,6 @@
 """Tests for GroupService class."""
 import sys
 import os
-from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from unittest.mock import MagicMock, Mock
 import pytest
@@ -16,6 +15,16 @@ from ygo74.fastapi_openai_rag.domain.unit_of_work import UnitOfWork
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_already_exists import EntityAlreadyExistsError
 from ygo74.fastapi_openai_rag.domain.exceptions.validation_error import ValidationError
+from tests._constants import FROZEN_NOW
+
+# Canonical group; tests derive their variants with model_copy(update=...)
+BASE_GROUP = Group(
+    id=1,
+    name="test-group",
+    description="Test description",
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
 
 
 class MockUnitOfWork:
@@ -41,53 +50,74 @@ class MockUnitOfWork:
     def rollback(self) -> None:
         self.rolled_back = True
 
+    def reset(self) -> None:
+        """Forget the outcome of previous transactions."""
+        self.session.reset_mock()
+        self.committed = False
+        self.rolled_back = False
+
+
+class RepositoryStub:
+    """Group repository stand-in exposing only the methods GroupService calls."""
+
+    def __init__(self) -> None:
+        self.get_by_name: Mock = Mock()
+        self.get_by_id: Mock = Mock()
+        self.get_all: Mock = Mock()
+        self.add: Mock = Mock()
+        self.update: Mock = Mock()
+        self.delete: Mock = Mock()
+        self.get_by_model_id: Mock = Mock()
+
+    def reset(self) -> None:
+        """Clear calls, return values and side effects of every method."""
+        for method in vars(self).values():
+            method.reset_mock(return_value=True, side_effect=True)
+
 
 class TestGroupService:
     """Test suite for GroupService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_uow(self) -> MockUnitOfWork:
-        """Create a mock Unit of Work."""
+        """Create a mock Unit of Work shared by the module."""
         return MockUnitOfWork()
 
-    @pytest.fixture
-    def mock_repository(self) -> Mock:
-        """Create a mock repository with all necessary methods."""
-        repository = Mock()
-        # Explicitly add the methods that will be called
-        repository.get_by_name = Mock()
-        repository.get_by_id = Mock()
-        repository.get_all = Mock()
-        repository.add = Mock()
-        repository.update = Mock()
-        repository.delete = Mock()
-        repository.get_by_model_id = Mock()
-        return repository
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def mock_repository(self) -> 'RepositoryStub':
+        """Create a repository stub with all necessary methods, shared by the module."""
+        return RepositoryStub()
+
+    @pytest.fixture(scope="module")
     def mock_repository_factory(self, mock_repository: Mock) -> Mock:
-        """Create a mock repository factory."""
+        """Create a mock repository factory shared by the module."""
         factory: Mock = Mock()
         factory.return_value = mock_repository
         return factory
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self, mock_uow: MockUnitOfWork, mock_repository_factory: Mock) -> GroupService:
-        """Create a GroupService instance with mocks."""
+        """Create a GroupService instance with mocks, shared by the module."""
         return GroupService(mock_uow, mock_repository_factory)
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_uow: MockUnitOfWork, mock_repository: 'RepositoryStub',
+                    mock_repository_factory: Mock) -> None:
+        """Reset the shared mocks before each test."""
+        mock_uow.reset()
+        mock_repository.reset()
+        mock_repository_factory.reset_mock()
+
     def test_add_group_success(self, service: GroupService, mock_repository: Mock) -> None:
         """Test successful group creation."""
         # arrange
         name: str = "test-group"
         description: str = "Test description"
-        new_group: Group = Group(
-            id=1,
-            name=name,
-            description=description,
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
+        new_group: Group = BASE_GROUP.model_copy(update={
+            "id": 1,
+            "name": name,
+            "description": description
+        })
         mock_repository.get_by_name.return_value = None
         mock_repository.add.return_value = new_group
 
@@ -107,13 +137,11 @@ class TestGroupService:
         """Test group creation with existing name."""
         # arrange
         name: str = "existing-group"
-        existing_group: Group = Group(
-            id=1,
-            name=name,
-            description="Existing description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
+        existing_group: Group = BASE_GROUP.model_copy(update={
+            "id": 1,
+            "name": name,
+            "description": "Existing description"
+        })
         mock_repository.get_by_name.return_value = existing_group
 
         # act & assert
@@ -132,20 +160,17 @@ class TestGroupService:
         group_id: int = 1
         updated_name: str = "updated-group"
         updated_description: str = "Updated description"
-        existing_group: Group = Group(
-            id=group_id,
-            name="original-group",
-            description="Original description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
-        updated_group: Group = Group(
-            id=group_id,
-            name=updated_name,
-            description=updated_description,
-            created=existing_group.created,
-            updated=datetime.now(timezone.utc)
-        )
+        existing_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": "original-group",
+            "description": "Original description"
+        })
+        updated_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": updated_name,
+            "description": updated_description,
+            "created": existing_group.created
+        })
         mock_repository.get_by_id.return_value = existing_group
         mock_repository.update.return_value = updated_group
 
@@ -182,20 +207,17 @@ class TestGroupService:
         # arrange
         group_id: int = 1
         new_name: str = "updated-name"
-        existing_group: Group = Group(
-            id=group_id,
-            name="original-name",
-            description="original-description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
-        updated_group: Group = Group(
-            id=group_id,
-            name=new_name,
-            description="original-description",  # Should keep original
-            created=existing_group.created,
-            updated=datetime.now(timezone.utc)
-        )
+        existing_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": "original-name",
+            "description": "original-description"
+        })
+        updated_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": new_name,
+            "description": "original-description",  # Should keep original
+            "created": existing_group.created
+        })
         mock_repository.get_by_id.return_value = existing_group
         mock_repository.update.return_value = updated_group
 
@@ -215,20 +237,16 @@ class TestGroupService:
         """Test getting all groups."""
         # arrange
         groups: List[Group] = [
-            Group(
-                id=1,
-                name="group1",
-                description="Description 1",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
-            ),
-            Group(
-                id=2,
-                name="group2",
-                description="Description 2",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
-            )
+            BASE_GROUP.model_copy(update={
+                "id": 1,
+                "name": "group1",
+                "description": "Description 1"
+            }),
+            BASE_GROUP.model_copy(update={
+                "id": 2,
+                "name": "group2",
+                "description": "Description 2"
+            })
         ]
         mock_repository.get_all.return_value = groups
 
@@ -259,13 +277,11 @@ class TestGroupService:
         """Test successful group deletion."""
         # arrange
         group_id: int = 1
-        existing_group: Group = Group(
-            id=group_id,
-            name="test-group",
-            description="Test description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
+        existing_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": "test-group",
+            "description": "Test description"
+        })
         mock_repository.get_by_id.return_value = existing_group
 
         # act
@@ -285,8 +301,8 @@ class TestGroupService:
         with pytest.raises(EntityNotFoundError, match=f"Group with identifier '{group_id}' not found"):
             service.delete_group(group_id)
 
-        # Verify remove was not called since group doesn't exist
-        mock_repository.remove.assert_not_called()
+        # Verify delete was not called since group doesn't exist
+        mock_repository.delete.assert_not_called()
 
     def test_unit_of_work_commit_on_success(self, mock_uow: MockUnitOfWork, mock_repository_factory: Mock) -> None:
         """Test that Unit of Work commits on successful operation."""
@@ -320,13 +336,11 @@ class TestGroupService:
         """Test getting group by ID."""
         # arrange
         group_id: int = 1
-        expected_group: Group = Group(
-            id=group_id,
-            name="test-group",
-            description="Test description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
+        expected_group: Group = BASE_GROUP.model_copy(update={
+            "id": group_id,
+            "name": "test-group",
+            "description": "Test description"
+        })
         mock_repository.get_by_id.return_value = expected_group
 
         # act
@@ -350,13 +364,11 @@ class TestGroupService:
         """Test getting group by name."""
         # arrange
         name: str = "test-group"
-        expected_group: Group = Group(
-            id=1,
-            name=name,
-            description="Test description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
-        )
+        expected_group: Group = BASE_GROUP.model_copy(update={
+            "id": 1,
+            "name": name,
+            "description": "Test description"
+        })
         mock_repository.get_by_name.return_value = expected_group
 
         # act
@@ -1,7 +1,6 @@
 """Tests for ModelService class."""
 import sys
 import os
-from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 from unittest.mock import MagicMock, Mock
 import pytest
@@ -18,6 +17,33 @@ from ygo74.fastapi_openai_rag.domain.unit_of_work import UnitOfWork
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_already_exists import EntityAlreadyExistsError
 from ygo74.fastapi_openai_rag.domain.exceptions.validation_error import ValidationError
+from tests._constants import FROZEN_NOW
+
+# Read-only models returned by the mocked repository, built once per module
+_ALL_MODELS: List[LlmModel] = [
+    LlmModel(
+        id=1,
+        url="http://test1.com",
+        name="model1",
+        technical_name="test_model1",
+        provider=LLMProvider.OPENAI,
+        status=LlmModelStatus.NEW,
+        capabilities={},
+        created=FROZEN_NOW,
+        updated=FROZEN_NOW
+    ),
+    LlmModel(
+        id=2,
+        url="http://test2.com",
+        name="model2",
+        technical_name="test_model2",
+        provider=LLMProvider.ANTHROPIC,
+        status=LlmModelStatus.APPROVED,
+        capabilities={},
+        created=FROZEN_NOW,
+        updated=FROZEN_NOW
+    )
+]
 
 
 class MockUnitOfWork:
@@ -43,41 +69,64 @@ class MockUnitOfWork:
     def rollback(self) -> None:
         self.rolled_back = True
 
+    def reset(self) -> None:
+        """Forget the outcome of previous transactions."""
+        self.session.reset_mock()
+        self.committed = False
+        self.rolled_back = False
+
+
+class RepositoryStub:
+    """Model repository stand-in exposing only the methods ModelService calls."""
+
+    def __init__(self) -> None:
+        self.get_by_technical_name: Mock = Mock()
+        self.get_by_id: Mock = Mock()
+        self.get_all: Mock = Mock()
+        self.add: Mock = Mock()
+        self.update: Mock = Mock()
+        self.delete: Mock = Mock()
+        self.get_by_model_provider: Mock = Mock()
+
+    def reset(self) -> None:
+        """Clear calls, return values and side effects of every method."""
+        for method in vars(self).values():
+            method.reset_mock(return_value=True, side_effect=True)
+
 
 class TestModelService:
     """Test suite for ModelService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_uow(self) -> MockUnitOfWork:
-        """Create a mock Unit of Work."""
+        """Create a mock Unit of Work shared by the module."""
         return MockUnitOfWork()
 
-    @pytest.fixture
-    def mock_repository(self) -> Mock:
-        """Create a mock repository with all necessary methods."""
-        repository = Mock()
-        # Explicitly add the methods that will be called
-        repository.get_by_technical_name = Mock()
-        repository.get_by_id = Mock()
-        repository.get_all = Mock()
-        repository.add = Mock()
-        repository.update = Mock()
-        repository.delete = Mock()
-        repository.get_by_group_id = Mock()
-        return repository
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def mock_repository(self) -> 'RepositoryStub':
+        """Create a repository stub with all necessary methods, shared by the module."""
+        return RepositoryStub()
+
+    @pytest.fixture(scope="module")
     def mock_repository_factory(self, mock_repository: Mock) -> Mock:
-        """Create a mock repository factory."""
+        """Create a mock repository factory shared by the module."""
         factory: Mock = Mock()
         factory.return_value = mock_repository
         return factory
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self, mock_uow: MockUnitOfWork, mock_repository_factory: Mock) -> ModelService:
-        """Create a ModelService instance with mocks."""
+        """Create a ModelService instance with mocks, shared by the module."""
         return ModelService(mock_uow, mock_repository_factory)
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_uow: MockUnitOfWork, mock_repository: 'RepositoryStub',
+                    mock_repository_factory: Mock) -> None:
+        """Reset the shared mocks before each test."""
+        mock_uow.reset()
+        mock_repository.reset()
+        mock_repository_factory.reset_mock()
+
     def test_add_model_success(self, service: ModelService, mock_repository: Mock) -> None:
         """Test successful model creation."""
         # arrange
@@ -94,8 +143,8 @@ class TestModelService:
             provider=provider,
             status=LlmModelStatus.NEW,
             capabilities=capabilities,
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_technical_name.return_value = None
         mock_repository.add.return_value = new_model
@@ -128,8 +177,8 @@ class TestModelService:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_technical_name.return_value = existing_model
 
@@ -172,8 +221,8 @@ class TestModelService:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         updated_model: LlmModel = LlmModel(
             id=model_id,
@@ -184,7 +233,7 @@ class TestModelService:
             status=LlmModelStatus.NEW,
             capabilities={},
             created=existing_model.created,
-            updated=datetime.now(timezone.utc)
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_id.return_value = existing_model
         mock_repository.update.return_value = updated_model
@@ -236,8 +285,8 @@ class TestModelService:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         updated_model: LlmModel = LlmModel(
             id=model_id,
@@ -248,7 +297,7 @@ class TestModelService:
             status=new_status,
             capabilities={},
             created=existing_model.created,
-            updated=datetime.now(timezone.utc)
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_id.return_value = existing_model
         mock_repository.update.return_value = updated_model
@@ -276,31 +325,7 @@ class TestModelService:
     def test_get_all_models(self, service: ModelService, mock_repository: Mock) -> None:
         """Test getting all models."""
         # arrange
-        models: List[LlmModel] = [
-            LlmModel(
-                id=1,
-                url="http://test1.com",
-                name="model1",
-                technical_name="test_model1",
-                provider=LLMProvider.OPENAI,
-                status=LlmModelStatus.NEW,
-                capabilities={},
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
-            ),
-            LlmModel(
-                id=2,
-                url="http://test2.com",
-                name="model2",
-                technical_name="test_model2",
-                provider=LLMProvider.ANTHROPIC,
-                status=LlmModelStatus.APPROVED,
-                capabilities={},
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
-            )
-        ]
-        mock_repository.get_all.return_value = models
+        mock_repository.get_all.return_value = _ALL_MODELS
 
         # act
         result: List[LlmModel] = service.get_all_models()
@@ -348,8 +373,8 @@ class TestModelService:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_id.return_value = expected_model
 
@@ -372,8 +397,8 @@ class TestModelService:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
         mock_repository.get_by_technical_name.return_value = [expected_model]
 
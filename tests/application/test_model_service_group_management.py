@@ -13,7 +13,7 @@ from ygo74.fastapi_openai_rag.domain.models.group import Group
 from ygo74.fastapi_openai_rag.domain.models.llm_model import LlmModel, LlmModelStatus
 from ygo74.fastapi_openai_rag.domain.models.llm import LLMProvider
 from ygo74.fastapi_openai_rag.application.services.model_service import ModelService
-from ygo74.fastapi_openai_rag.infrastructure.db.repositories.group_repository import SQLGroupRepository
+from ygo74.fastapi_openai_rag.application.services import group_service as group_service_module
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
 
 class MockUnitOfWork:
@@ -133,8 +133,7 @@ def test_add_model_to_group_success(
     def mock_group_repo_init(session):
         return mock_group_repository
 
-    monkeypatch.setattr(SQLGroupRepository, "__init__", lambda self, session: None)
-    monkeypatch.setattr(SQLGroupRepository, "__new__", lambda cls, session: mock_group_repository)
+    monkeypatch.setattr(group_service_module, "SQLGroupRepository", lambda session: mock_group_repository)
 
     # act
     result = service.add_model_to_group(model_id, group_id)
@@ -163,8 +162,7 @@ def test_add_model_to_group_model_not_found(
     mock_model_repository.get_by_id.return_value = None
 
     # Patch the SQLGroupRepository constructor to return our mock
-    monkeypatch.setattr(SQLGroupRepository, "__init__", lambda self, session: None)
-    monkeypatch.setattr(SQLGroupRepository, "__new__", lambda cls, session: mock_group_repository)
+    monkeypatch.setattr(group_service_module, "SQLGroupRepository", lambda session: mock_group_repository)
 
     # act & assert
     with pytest.raises(EntityNotFoundError, match=f"Model with identifier '{model_id}' not found"):
@@ -205,8 +203,7 @@ def test_add_model_to_group_group_not_found(
     mock_group_repository.get_by_id.return_value = None
 
     # Patch the SQLGroupRepository constructor to return our mock
-    monkeypatch.setattr(SQLGroupRepository, "__init__", lambda self, session: None)
-    monkeypatch.setattr(SQLGroupRepository, "__new__", lambda cls, session: mock_group_repository)
+    monkeypatch.setattr(group_service_module, "SQLGroupRepository", lambda session: mock_group_repository)
 
     # act & assert
     with pytest.raises(EntityNotFoundError, match=f"Group with identifier '{group_id}' not found"):
@@ -256,8 +253,7 @@ def test_add_model_to_group_already_associated(
     mock_group_repository.get_by_id.return_value = group
 
     # Patch the SQLGroupRepository constructor to return our mock
-    monkeypatch.setattr(SQLGroupRepository, "__init__", lambda self, session: None)
-    monkeypatch.setattr(SQLGroupRepository, "__new__", lambda cls, session: mock_group_repository)
+    monkeypatch.setattr(group_service_module, "SQLGroupRepository", lambda session: mock_group_repository)
 
     # act
     result = service.add_model_to_group(model_id, group_id)
@@ -4,21 +4,26 @@ import logging
 import sys
 import os
 from pathlib import Path
-from typing import List, Optional, Any
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import NoResultFound
+
+# Load the sample configuration unless the caller points CONFIG_FILE elsewhere;
+# must be set before the application, and its ConfigService, are imported
+os.environ.setdefault("CONFIG_FILE", str(Path(__file__).parent.parent / "config.json.example"))
+
 from ygo74.fastapi_openai_rag.main import app
 from ygo74.fastapi_openai_rag.infrastructure.db.models.base import Base
 from ygo74.fastapi_openai_rag.infrastructure.db.session import get_db
-from unittest.mock import MagicMock
+from tests._mocks import MockSession
+from fastapi.testclient import TestClient
 
 # Add src directory to Python path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-# Create test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Create test database, one file per pytest-xdist worker when running in parallel
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///./test{'_' + _XDIST_WORKER if _XDIST_WORKER else ''}.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -81,6 +86,20 @@ def setup_test_environment(request):
     print("Tearing down test environment...")
 
 
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Shared test client for the whole test session.
+
+    The application lifespan (telemetry, configuration, database init) runs
+    once; tests needing fresh service state must reset their own mocks.
+
+    Yields:
+        TestClient: Client bound to the FastAPI application
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture(autouse=True)
 def enable_debug_logging(caplog, request):
     """Enable debug logging for application modules when needed."""
@@ -118,150 +137,6 @@ def enable_debug_logging(caplog, request):
         print("--- End of captured logs ---\n")
 
 
-class MockQuery:
-    """Mock SQLAlchemy query for testing."""
-
-    def __init__(self, result: List[Any]) -> None:
-        self.result: List[Any] = result
-
-    def filter(self, *args: Any) -> 'MockQuery':
-        """Mock filter method."""
-        return self
-
-    def first(self) -> Optional[Any]:
-        """Mock first method."""
-        return self.result[0] if self.result else None
-
-    def get(self, id: int) -> Optional[Any]:
-        """Mock get method."""
-        return self.result[0] if self.result else None
-
-    def all(self) -> List[Any]:
-        """Mock all method."""
-        return self.result
-
-    def one(self) -> Any:
-        """Mock one method."""
-        if self.result:
-            return self.result[0]
-        raise NoResultFound()
-
-
-class MockSession:
-    """Mock SQLAlchemy session for testing."""
-
-    def __init__(self) -> None:
-        """Initialize mock session."""
-        self.query_result: List[Any] = []
-        self.added_items: List[Any] = []
-        self.merged_items: List[Any] = []
-        self.deleted: bool = False
-        self.execute_result: Any = MagicMock()
-        self.committed: bool = False
-        self.get_result: Optional[Any] = None
-
-        # Create a mock query object
-        self.query = MagicMock()
-
-    def set_query_result(self, result: List[Any]) -> None:
-        """Set result for query method.
-
-        Args:
-            result: Result to return from query
-        """
-        # Ensure we have a proper MagicMock for query
-        self.query = MagicMock()
-        self.query.all.return_value = result
-        self.query.first.return_value = result[0] if result else None
-        self.query.filter.return_value = self.query
-        self.query.filter_by.return_value = self.query
-        self.query.options.return_value = self.query
-        self.query.join.return_value = self.query
-        self.query.where.return_value = self.query
-
-        # Add method to handle get with ID
-        self.query.get.side_effect = lambda id: next((item for item in result if item.id == id), None)
-
-    def set_execute_result(self, result: MagicMock) -> None:
-        """Set result for execute method.
-
-        Args:
-            result: Mock result to return from execute
-        """
-        self.execute_result = result
-
-    def add(self, item):
-        """Mock add method.
-
-        Args:
-            item: Item to add
-        """
-        self.added_items.append(item)
-        # Set ID if not already set
-        if not hasattr(item, 'id') or item.id is None:
-            item.id = len(self.added_items)
-
-    def merge(self, item):
-        """Mock merge method.
-
-        Args:
-            item: Item to merge
-        """
-        self.merged_items.append(item)
-        return item
-
-    def delete(self, item):
-        """Mock delete method.
-
-        Args:
-            item: Item to delete
-        """
-        self.deleted = True
-
-    def commit(self):
-        """Mock commit method."""
-        self.committed = True
-
-    def rollback(self):
-        """Mock rollback method."""
-        pass
-
-    def flush(self):
-        """Mock flush method."""
-        pass
-
-    def refresh(self, item):
-        """Mock refresh method.
-
-        Args:
-            item: Item to refresh
-        """
-        pass
-
-    def execute(self, stmt):
-        """Mock execute method.
-
-        Args:
-            stmt: Statement to execute
-
-        Returns:
-            Mock result
-        """
-        return self.execute_result
-
-    def get(self, model_class, entity_id):
-        """Mock get method.
-
-        Args:
-            model_class: Model class to get
-            entity_id: Entity ID to get
-
-        Returns:
-            Entity if found, None otherwise
-        """
-        return self.get_result
-
-
 @pytest.fixture(autouse=True)
 def test_db():
     """Create a fresh database for each test.
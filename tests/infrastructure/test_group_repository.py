@@ -1,7 +1,6 @@
 """Unit tests for SQLGroupRepository."""
 import sys
 import os
-from datetime import datetime, timezone
 from typing import List, Optional
 from unittest.mock import Mock, MagicMock
 import pytest
@@ -13,7 +12,7 @@ from ygo74.fastapi_openai_rag.domain.models.group import Group
 from ygo74.fastapi_openai_rag.infrastructure.db.models.group_orm import GroupORM
 from ygo74.fastapi_openai_rag.infrastructure.db.repositories.group_repository import SQLGroupRepository
 from ygo74.fastapi_openai_rag.infrastructure.db.mappers.group_mapper import GroupMapper
-from tests.conftest import MockSession
+from tests._constants import FROZEN_NOW
 
 class TestSQLGroupRepository:
     """Test suite for SQLGroupRepository class."""
@@ -31,8 +30,8 @@ class TestSQLGroupRepository:
             id=1,
             name=name,
             description="Test Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
 
         mock_result = Mock()
@@ -71,15 +70,15 @@ class TestSQLGroupRepository:
                 id=1,
                 name="Group 1",
                 description="Description 1",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
+                created=FROZEN_NOW,
+                updated=FROZEN_NOW
             ),
             GroupORM(
                 id=2,
                 name="Group 2",
                 description="Description 2",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
+                created=FROZEN_NOW,
+                updated=FROZEN_NOW
             )
         ]
 
@@ -131,8 +130,8 @@ class TestSQLGroupRepository:
             id=group_id,
             name="Test Group",
             description="Test Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
 
         # Set up mock for get method
@@ -168,15 +167,15 @@ class TestSQLGroupRepository:
                 id=1,
                 name="Group 1",
                 description="Description 1",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
+                created=FROZEN_NOW,
+                updated=FROZEN_NOW
             ),
             GroupORM(
                 id=2,
                 name="Group 2",
                 description="Description 2",
-                created=datetime.now(timezone.utc),
-                updated=datetime.now(timezone.utc)
+                created=FROZEN_NOW,
+                updated=FROZEN_NOW
             )
         ]
 
@@ -200,8 +199,8 @@ class TestSQLGroupRepository:
         group = Group(
             name="New Group",
             description="New Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             models=[]
         )
 
@@ -238,8 +237,8 @@ class TestSQLGroupRepository:
             id=1,
             name="Updated Group",
             description="Updated Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             models=[]
         )
 
@@ -248,8 +247,8 @@ class TestSQLGroupRepository:
             id=1,
             name="Original Group",
             description="Original Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
 
         # Setup updated ORM entity to be returned after update
@@ -281,8 +280,8 @@ class TestSQLGroupRepository:
             id=999,
             name="Non-existent Group",
             description="Non-existent Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             models=[]
         )
 
@@ -305,8 +304,8 @@ class TestSQLGroupRepository:
             id=group_id,
             name="Group to Delete",
             description="Description",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
 
         # Set up mock for get method
@@ -1,7 +1,7 @@
 """Unit tests for SQLModelRepository."""
 import sys
 import os
-from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import List, Optional
 from unittest.mock import MagicMock
 import pytest
@@ -11,9 +11,53 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from ygo74.fastapi_openai_rag.domain.models.llm import LLMProvider
 from ygo74.fastapi_openai_rag.domain.models.llm_model import LlmModel, LlmModelStatus
-from ygo74.fastapi_openai_rag.infrastructure.db.models.model_orm import ModelORM
 from ygo74.fastapi_openai_rag.infrastructure.db.repositories.model_repository import SQLModelRepository
-from tests.conftest import MockSession
+from tests._constants import FROZEN_NOW
+from tests._mocks import MockSession
+
+# Read-only rows returned by the mocked queries, built once per module
+_MODEL_ROWS: List[SimpleNamespace] = [
+    SimpleNamespace(
+        id=1,
+        url="http://test1.com",
+        name="Model 1",
+        technical_name="model_1",
+        provider="openai",
+        status=LlmModelStatus.NEW,
+        capabilities={},
+        created=FROZEN_NOW,
+        updated=FROZEN_NOW,
+        groups=[]
+    ),
+    SimpleNamespace(
+        id=2,
+        url="http://test2.com",
+        name="Model 2",
+        technical_name="model_2",
+        provider="anthropic",
+        status=LlmModelStatus.APPROVED,
+        capabilities={},
+        created=FROZEN_NOW,
+        updated=FROZEN_NOW,
+        groups=[]
+    )
+]
+# Domain models matching _MODEL_ROWS
+_DOMAIN_MODELS: List[LlmModel] = [
+    LlmModel(
+        id=row.id,
+        url=row.url,
+        name=row.name,
+        technical_name=row.technical_name,
+        provider=LLMProvider(row.provider),
+        status=row.status,
+        capabilities=row.capabilities,
+        created=row.created,
+        updated=row.updated,
+        groups=[]
+    )
+    for row in _MODEL_ROWS
+]
 
 
 class TestSQLModelRepository:
@@ -28,17 +72,18 @@ class TestSQLModelRepository:
         """Test getting model by technical name when it exists."""
         # arrange
         technical_name: str = "test_model"
-        expected_model: ModelORM = ModelORM()
-        expected_model.id = 1
-        expected_model.url = "http://test.com"
-        expected_model.name = "Test Model"
-        expected_model.technical_name = technical_name
-        expected_model.provider = "openai"  # Use lowercase to match enum
-        expected_model.status = LlmModelStatus.NEW
-        expected_model.capabilities = {}
-        expected_model.created = datetime.now(timezone.utc)
-        expected_model.updated = datetime.now(timezone.utc)
-        expected_model.groups = []
+        expected_model = SimpleNamespace(
+            id=1,
+            url="http://test.com",
+            name="Test Model",
+            technical_name=technical_name,
+            provider="openai",  # Use lowercase to match enum
+            status=LlmModelStatus.NEW,
+            capabilities={},
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
+            groups=[]
+        )
 
         # Mock execute result for select query
         mock_result = MagicMock()
@@ -57,7 +102,7 @@ class TestSQLModelRepository:
         """Test getting Azure model by technical name."""
         # arrange
         technical_name: str = "azure_test_model"
-        expected_model: ModelORM = ModelORM(
+        expected_model = SimpleNamespace(
             id=1,
             url="https://test.openai.azure.com",
             name="Azure Test Model",
@@ -65,10 +110,10 @@ class TestSQLModelRepository:
             provider="azure",
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc)
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
+            groups=[]
         )
-        expected_model.groups = []
 
         # Mock execute result for select query
         mock_result = MagicMock()
@@ -104,37 +149,10 @@ class TestSQLModelRepository:
         """Test getting models by group ID when models exist."""
         # arrange
         group_id: int = 1
-        models: List[ModelORM] = []
-
-        model1 = ModelORM()
-        model1.id = 1
-        model1.url = "http://test1.com"
-        model1.name = "Model 1"
-        model1.technical_name = "model_1"
-        model1.provider = "openai"
-        model1.status = LlmModelStatus.NEW
-        model1.capabilities = {}
-        model1.created = datetime.now(timezone.utc)
-        model1.updated = datetime.now(timezone.utc)
-        model1.groups = []
-
-        model2 = ModelORM()
-        model2.id = 2
-        model2.url = "http://test2.com"
-        model2.name = "Model 2"
-        model2.technical_name = "model_2"
-        model2.provider = "anthropic"
-        model2.status = LlmModelStatus.APPROVED
-        model2.capabilities = {}
-        model2.created = datetime.now(timezone.utc)
-        model2.updated = datetime.now(timezone.utc)
-        model2.groups = []
-
-        models.extend([model1, model2])
 
         # Mock the execute result
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = models
+        mock_result.scalars.return_value.all.return_value = _MODEL_ROWS
         session.set_execute_result(mock_result)
 
         # act
@@ -176,17 +194,18 @@ class TestSQLModelRepository:
         """Test getting model by ID when it exists."""
         # arrange
         model_id: int = 1
-        expected_model: ModelORM = ModelORM()
-        expected_model.id = model_id
-        expected_model.url = "http://test.com"
-        expected_model.name = "Test Model"
-        expected_model.technical_name = "test_model"
-        expected_model.provider = "openai"
-        expected_model.status = LlmModelStatus.NEW
-        expected_model.capabilities = {}
-        expected_model.created = datetime.now(timezone.utc)
-        expected_model.updated = datetime.now(timezone.utc)
-        expected_model.groups = []
+        expected_model = SimpleNamespace(
+            id=model_id,
+            url="http://test.com",
+            name="Test Model",
+            technical_name="test_model",
+            provider="openai",
+            status=LlmModelStatus.NEW,
+            capabilities={},
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
+            groups=[]
+        )
 
         # Set up mock for get method
         session.get_result = expected_model
@@ -216,71 +235,15 @@ class TestSQLModelRepository:
     def test_get_all_models(self, repository: SQLModelRepository, session: MockSession) -> None:
         """Test getting all models."""
         # arrange
-        models: List[ModelORM] = []
-
-        model1 = ModelORM()
-        model1.id = 1
-        model1.url = "http://test1.com"
-        model1.name = "Model 1"
-        model1.technical_name = "model_1"
-        model1.provider = "openai"
-        model1.status = LlmModelStatus.NEW
-        model1.capabilities = {}
-        model1.created = datetime.now(timezone.utc)
-        model1.updated = datetime.now(timezone.utc)
-        model1.groups = []
-
-        model2 = ModelORM()
-        model2.id = 2
-        model2.url = "http://test2.com"
-        model2.name = "Model 2"
-        model2.technical_name = "model_2"
-        model2.provider = "anthropic"
-        model2.status = LlmModelStatus.APPROVED
-        model2.capabilities = {}
-        model2.created = datetime.now(timezone.utc)
-        model2.updated = datetime.now(timezone.utc)
-        model2.groups = []
-
-        models.extend([model1, model2])
-
-        # Configure mock_mapper to return domain objects
-        mock_domain_models = [
-            LlmModel(
-                id=model1.id,
-                url=model1.url,
-                name=model1.name,
-                technical_name=model1.technical_name,
-                provider=LLMProvider.OPENAI,
-                status=model1.status,
-                capabilities=model1.capabilities,
-                created=model1.created,
-                updated=model1.updated,
-                groups=[]
-            ),
-            LlmModel(
-                id=model2.id,
-                url=model2.url,
-                name=model2.name,
-                technical_name=model2.technical_name,
-                provider=LLMProvider.ANTHROPIC,
-                status=model2.status,
-                capabilities=model2.capabilities,
-                created=model2.created,
-                updated=model2.updated,
-                groups=[]
-            )
-        ]
-
         # Configure the query mock
         mock_query = MagicMock()
-        mock_query.all.return_value = models
+        mock_query.all.return_value = _MODEL_ROWS
         session.query = MagicMock(return_value=mock_query)
 
         # Configure mapper mock in repository
         repository._mapper.to_domain = MagicMock(side_effect=lambda orm: next(
-            (m for m in mock_domain_models if m.id == orm.id),
-            mock_domain_models[0]
+            (m for m in _DOMAIN_MODELS if m.id == orm.id),
+            _DOMAIN_MODELS[0]
         ))
 
         # act
@@ -301,23 +264,24 @@ class TestSQLModelRepository:
             provider=LLMProvider.OPENAI,
             status=LlmModelStatus.NEW,
             capabilities={"test": True},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             groups=[]
         )
 
         # Mock the returned ORM object after add
-        orm_result = ModelORM()
-        orm_result.id = 1
-        orm_result.url = "http://test.com"  # Ensure this matches the input
-        orm_result.name = "Test Model"
-        orm_result.technical_name = "test_model"
-        orm_result.provider = "openai"
-        orm_result.status = LlmModelStatus.NEW
-        orm_result.capabilities = {"test": True}
-        orm_result.created = model.created
-        orm_result.updated = model.updated
-        orm_result.groups = []
+        orm_result = SimpleNamespace(
+            id=1,
+            url="http://test.com",  # Ensure this matches the input
+            name="Test Model",
+            technical_name="test_model",
+            provider="openai",
+            status=LlmModelStatus.NEW,
+            capabilities={"test": True},
+            created=model.created,
+            updated=model.updated,
+            groups=[]
+        )
 
         # Configure mapper to return domain model matching the input
         repository._mapper.to_domain = MagicMock(return_value=model)
@@ -355,23 +319,24 @@ class TestSQLModelRepository:
             provider=LLMProvider.AZURE,
             status=LlmModelStatus.NEW,
             capabilities={"azure": True},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             groups=[]
         )
 
         # Mock the returned ORM object after add
-        orm_result = ModelORM()
-        orm_result.id = 1
-        orm_result.url = "https://test.openai.azure.com"  # Ensure this matches the input
-        orm_result.name = "Azure Test Model"
-        orm_result.technical_name = "azure_test_model"
-        orm_result.provider = "azure"
-        orm_result.status = LlmModelStatus.NEW
-        orm_result.capabilities = {"azure": True}
-        orm_result.created = model.created
-        orm_result.updated = model.updated
-        orm_result.groups = []
+        orm_result = SimpleNamespace(
+            id=1,
+            url="https://test.openai.azure.com",  # Ensure this matches the input
+            name="Azure Test Model",
+            technical_name="azure_test_model",
+            provider="azure",
+            status=LlmModelStatus.NEW,
+            capabilities={"azure": True},
+            created=model.created,
+            updated=model.updated,
+            groups=[]
+        )
 
         # Configure mapper to return domain model matching the input
         repository._mapper.to_domain = MagicMock(return_value=model)
@@ -411,22 +376,23 @@ class TestSQLModelRepository:
             provider=LLMProvider.ANTHROPIC,
             status=LlmModelStatus.APPROVED,
             capabilities={"updated": True},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             groups=[]
         )
 
-        existing_orm: ModelORM = ModelORM()
-        existing_orm.id = 1
-        existing_orm.url = "http://original.com"
-        existing_orm.name = "Original Model"
-        existing_orm.technical_name = "original_model"
-        existing_orm.provider = "openai"
-        existing_orm.status = LlmModelStatus.NEW
-        existing_orm.capabilities = {}
-        existing_orm.created = datetime.now(timezone.utc)
-        existing_orm.updated = datetime.now(timezone.utc)
-        existing_orm.groups = []
+        existing_orm = SimpleNamespace(
+            id=1,
+            url="http://original.com",
+            name="Original Model",
+            technical_name="original_model",
+            provider="openai",
+            status=LlmModelStatus.NEW,
+            capabilities={},
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
+            groups=[]
+        )
 
         # Set up mock for get method to return the existing model first, then updated model
         session.get_result = existing_orm
@@ -450,8 +416,8 @@ class TestSQLModelRepository:
             provider=LLMProvider.AZURE,
             status=LlmModelStatus.NEW,
             capabilities={},
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
             groups=[]
         )
 
@@ -472,17 +438,18 @@ class TestSQLModelRepository:
         """Test removing existing model."""
         # arrange
         model_id: int = 1
-        existing_orm: ModelORM = ModelORM()
-        existing_orm.id = model_id
-        existing_orm.url = "http://test.com"
-        existing_orm.name = "Model to Delete"
-        existing_orm.technical_name = "model_to_delete"
-        existing_orm.provider = "openai"
-        existing_orm.status = LlmModelStatus.NEW
-        existing_orm.capabilities = {}
-        existing_orm.created = datetime.now(timezone.utc)
-        existing_orm.updated = datetime.now(timezone.utc)
-        existing_orm.groups = []
+        existing_orm = SimpleNamespace(
+            id=model_id,
+            url="http://test.com",
+            name="Model to Delete",
+            technical_name="model_to_delete",
+            provider="openai",
+            status=LlmModelStatus.NEW,
+            capabilities={},
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW,
+            groups=[]
+        )
 
         # Set up mock for get method to return the model
         session.get_result = existing_orm
@@ -0,0 +1,64 @@
+"""Shared test entities for the interfaces tests.
+
+PYTEST_DONT_REWRITE
+"""
+
+from ygo74.fastapi_openai_rag.domain.models.group import Group
+from ygo74.fastapi_openai_rag.domain.models.llm import LLMProvider
+from ygo74.fastapi_openai_rag.domain.models.llm_model import LlmModel, LlmModelStatus
+from tests._constants import FROZEN_NOW
+
+# Shared read-only entities; model_copy(deep=True) before mutating
+MODEL_1: LlmModel = LlmModel(
+    id=1,
+    url="http://test1.com",
+    name="Test Model 1",
+    technical_name="test_model_1",
+    provider=LLMProvider.OPENAI,
+    status=LlmModelStatus.APPROVED,
+    capabilities={"feature": "test1"},
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
+MODEL_2: LlmModel = LlmModel(
+    id=2,
+    url="http://test2.com",
+    name="Test Model 2",
+    technical_name="test_model_2",
+    provider=LLMProvider.ANTHROPIC,
+    status=LlmModelStatus.NEW,
+    capabilities={"feature": "test2"},
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
+MODEL_3: LlmModel = LlmModel(
+    id=3,
+    url="http://test3.com",
+    name="Test Model 3",
+    technical_name="test_model_3",
+    provider=LLMProvider.AZURE,
+    status=LlmModelStatus.APPROVED,
+    capabilities={},
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
+
+TEST_MODEL: LlmModel = LlmModel(
+    id=1,
+    url="http://test.com",
+    name="Test Model",
+    technical_name="test_model",
+    provider=LLMProvider.OPENAI,
+    status=LlmModelStatus.NEW,
+    capabilities={},
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
+
+TEST_GROUP: Group = Group(
+    id=1,
+    name="Test Group",
+    description="Test Description",
+    created=FROZEN_NOW,
+    updated=FROZEN_NOW
+)
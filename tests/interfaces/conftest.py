@@ -0,0 +1,41 @@
+"""Dependency overrides shared by the interfaces tests."""
+from unittest.mock import Mock
+import pytest
+
+from ygo74.fastapi_openai_rag.application.services.model_service import ModelService
+from ygo74.fastapi_openai_rag.domain.models.autenticated_user import AuthenticatedUser
+from ygo74.fastapi_openai_rag.interfaces.api.endpoints.models import get_model_service
+from ygo74.fastapi_openai_rag.interfaces.api.security.auth import auth_jwt_or_api_key, require_admin_role
+from ygo74.fastapi_openai_rag.main import app
+
+ADMIN_USER: AuthenticatedUser = AuthenticatedUser(id="admin", username="admin", groups=["admin"], type="jwt")
+
+
+@pytest.fixture(scope="module")
+def admin_user() -> AuthenticatedUser:
+    """Authenticate the requests of the module as an admin user."""
+    app.dependency_overrides[require_admin_role] = lambda: ADMIN_USER
+    app.dependency_overrides[auth_jwt_or_api_key] = lambda: ADMIN_USER
+
+    yield ADMIN_USER
+
+    app.dependency_overrides.pop(require_admin_role, None)
+    app.dependency_overrides.pop(auth_jwt_or_api_key, None)
+
+
+@pytest.fixture(scope="module")
+def overridden_model_service() -> Mock:
+    """Inject a mocked ModelService through FastAPI dependency overrides."""
+    service_instance = Mock(spec=ModelService)
+    app.dependency_overrides[get_model_service] = lambda: service_instance
+
+    yield service_instance
+
+    app.dependency_overrides.pop(get_model_service, None)
+
+
+@pytest.fixture
+def mock_model_service(overridden_model_service: Mock) -> Mock:
+    """Mock ModelService for testing, reset before each test."""
+    overridden_model_service.reset_mock(return_value=True, side_effect=True)
+    yield overridden_model_service
@@ -1,9 +1,7 @@
 """Tests for model-group association endpoints."""
 import sys
 import os
-from datetime import datetime, timezone
-from typing import List, Dict, Any
-from unittest.mock import patch, MagicMock
+from typing import Tuple
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import status
@@ -12,74 +10,31 @@ from fastapi import status
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from ygo74.fastapi_openai_rag.domain.models.group import Group
-from ygo74.fastapi_openai_rag.domain.models.llm_model import LlmModel, LlmModelStatus
-from ygo74.fastapi_openai_rag.domain.models.llm import LLMProvider
 from ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
-from ygo74.fastapi_openai_rag.main import app
-
-client = TestClient(app)
-
-
-def create_test_model() -> LlmModel:
-    """Create a test model."""
-    return LlmModel(
-        id=1,
-        url="http://test.com",
-        name="Test Model",
-        technical_name="test_model",
-        provider=LLMProvider.OPENAI,
-        status=LlmModelStatus.NEW,
-        capabilities={},
-        created=datetime.now(timezone.utc),
-        updated=datetime.now(timezone.utc),
-        groups=[]
-    )
-
-
-def create_test_group() -> Group:
-    """Create a test group."""
-    return Group(
-        id=1,
-        name="Test Group",
-        description="Test Description",
-        created=datetime.now(timezone.utc),
-        updated=datetime.now(timezone.utc),
-        models=[]
-    )
-
-
-@pytest.fixture
-def mock_auth():
-    """Mock the authentication dependency."""
-    with patch("ygo74.fastapi_openai_rag.interfaces.api.decorators.require_oauth_role") as mock:
-        # Configure the decorator to just call the decorated function
-        mock.return_value = lambda func: func
-        yield mock
-
-
-@pytest.fixture
-def mock_model_service():
-    """Mock the model service."""
-    with patch("ygo74.fastapi_openai_rag.interfaces.api.endpoints.models.ModelService") as mock:
-        yield mock
-
-
-def test_add_group_to_model_success(mock_auth, mock_model_service):
+
+from tests._constants import FROZEN_NOW
+from tests.interfaces._fixtures import TEST_MODEL, TEST_GROUP
+
+# Every request of the module is authenticated as an admin
+pytestmark = pytest.mark.usefixtures("admin_user")
+
+
+def test_add_group_to_model_success(client: TestClient, mock_model_service):
     """Test adding a group to a model successfully."""
     # arrange
     model_id = 1
     group_id = 2
-    model = create_test_model()
-    group = create_test_group()
+    model = TEST_MODEL.model_copy(deep=True)
+    group = TEST_GROUP.model_copy(deep=True)
     group.id = group_id
     model.groups = [group]
 
     # Configure mock
-    service_instance = mock_model_service.return_value
+    service_instance = mock_model_service
     service_instance.add_model_to_group.return_value = model
 
     # act
-    response = client.post(f"/v1/models/{model_id}/groups/{group_id}")
+    response = client.post(f"/v1/admin/models/{model_id}/groups/{group_id}")
 
     # assert
     assert response.status_code == status.HTTP_200_OK
@@ -90,37 +45,43 @@ def test_add_group_to_model_success(mock_auth, mock_model_service):
     service_instance.add_model_to_group.assert_called_once_with(model_id, group_id)
 
 
-def test_add_group_to_model_not_found(mock_auth, mock_model_service):
-    """Test adding a group to a model when not found."""
+@pytest.mark.parametrize("http_method,path,svc_method,expected_args", [
+    ("post", "/v1/admin/models/1/groups/2", "add_model_to_group", (1, 2)),
+    ("delete", "/v1/admin/models/1/groups/2", "remove_model_from_group", (1, 2)),
+    ("get", "/v1/admin/models/1/groups", "get_groups_for_model", (1,)),
+])
+def test_model_group_association_not_found(client: TestClient, mock_model_service,
+                                           http_method: str, path: str, svc_method: str,
+                                           expected_args: Tuple[int, ...]):
+    """Test model-group association endpoints when the model is not found."""
     # arrange
     model_id = 1
-    group_id = 2
 
     # Configure mock
-    service_instance = mock_model_service.return_value
-    service_instance.add_model_to_group.side_effect = EntityNotFoundError("Model", str(model_id))
+    service_instance = mock_model_service
+    getattr(service_instance, svc_method).side_effect = EntityNotFoundError("Model", str(model_id))
 
     # act
-    response = client.post(f"/v1/models/{model_id}/groups/{group_id}")
+    response = client.request(http_method, path)
 
     # assert
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    service_instance.add_model_to_group.assert_called_once_with(model_id, group_id)
+    getattr(service_instance, svc_method).assert_called_once_with(*expected_args)
 
 
-def test_remove_group_from_model_success(mock_auth, mock_model_service):
+def test_remove_group_from_model_success(client: TestClient, mock_model_service):
     """Test removing a group from a model successfully."""
     # arrange
     model_id = 1
     group_id = 2
-    model = create_test_model()
+    model = TEST_MODEL
 
     # Configure mock
-    service_instance = mock_model_service.return_value
+    service_instance = mock_model_service
     service_instance.remove_model_from_group.return_value = model
 
     # act
-    response = client.delete(f"/v1/models/{model_id}/groups/{group_id}")
+    response = client.delete(f"/v1/admin/models/{model_id}/groups/{group_id}")
 
     # assert
     assert response.status_code == status.HTTP_200_OK
@@ -130,25 +91,7 @@ def test_remove_group_from_model_success(mock_auth, mock_model_service):
     service_instance.remove_model_from_group.assert_called_once_with(model_id, group_id)
 
 
-def test_remove_group_from_model_not_found(mock_auth, mock_model_service):
-    """Test removing a group from a model when not found."""
-    # arrange
-    model_id = 1
-    group_id = 2
-
-    # Configure mock
-    service_instance = mock_model_service.return_value
-    service_instance.remove_model_from_group.side_effect = EntityNotFoundError("Model", str(model_id))
-
-    # act
-    response = client.delete(f"/v1/models/{model_id}/groups/{group_id}")
-
-    # assert
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    service_instance.remove_model_from_group.assert_called_once_with(model_id, group_id)
-
-
-def test_get_groups_for_model_success(mock_auth, mock_model_service):
+def test_get_groups_for_model_success(client: TestClient, mock_model_service):
     """Test getting groups for model successfully."""
     # arrange
     model_id = 1
@@ -157,26 +100,24 @@ def test_get_groups_for_model_success(mock_auth, mock_model_service):
             id=1,
             name="Group 1",
             description="Description 1",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
-            models=[]
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         ),
         Group(
             id=2,
             name="Group 2",
             description="Description 2",
-            created=datetime.now(timezone.utc),
-            updated=datetime.now(timezone.utc),
-            models=[]
+            created=FROZEN_NOW,
+            updated=FROZEN_NOW
         )
     ]
 
     # Configure mock
-    service_instance = mock_model_service.return_value
+    service_instance = mock_model_service
     service_instance.get_groups_for_model.return_value = groups
 
     # act
-    response = client.get(f"/v1/models/{model_id}/groups")
+    response = client.get(f"/v1/admin/models/{model_id}/groups")
 
     # assert
     assert response.status_code == status.HTTP_200_OK
@@ -185,20 +126,3 @@ def test_get_groups_for_model_success(mock_auth, mock_model_service):
     assert "Group 1" in data
     assert "Group 2" in data
     service_instance.get_groups_for_model.assert_called_once_with(model_id)
-
-
-def test_get_groups_for_model_not_found(mock_auth, mock_model_service):
-    """Test getting groups for model when model not found."""
-    # arrange
-    model_id = 1
-
-    # Configure mock
-    service_instance = mock_model_service.return_value
-    service_instance.get_groups_for_model.side_effect = EntityNotFoundError("Model", str(model_id))
-
-    # act
-    response = client.get(f"/v1/models/{model_id}/groups")
-
-    # assert
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    service_instance.get_groups_for_model.assert_called_once_with(model_id)
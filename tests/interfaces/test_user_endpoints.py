@@ -1,35 +1,49 @@
 """Tests for user endpoints."""
 import pytest
-from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
-from datetime import datetime, timezone
-from src.ygo74.fastapi_openai_rag.domain.models.user import User, ApiKey
-from src.ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
-from src.ygo74.fastapi_openai_rag.domain.exceptions.entity_already_exists import EntityAlreadyExistsError
-from src.ygo74.fastapi_openai_rag.domain.models.autenticated_user import AuthenticatedUser
-from src.ygo74.fastapi_openai_rag.interfaces.api.endpoints.users import router, get_user_service, require_admin_role
+from unittest.mock import Mock
+from ygo74.fastapi_openai_rag.domain.models.user import User, ApiKey
+from ygo74.fastapi_openai_rag.domain.exceptions.entity_not_found_exception import EntityNotFoundError
+from ygo74.fastapi_openai_rag.domain.exceptions.entity_already_exists import EntityAlreadyExistsError
+from ygo74.fastapi_openai_rag.interfaces.api.endpoints.users import get_user_service
+from ygo74.fastapi_openai_rag.main import app
+from tests._constants import FROZEN_NOW
+
+# Canonical entities, built without validation; tests derive their variants
+# with model_copy(update=...)
+BASE_USER = User.model_construct(
+    id="user-1",
+    username="user1",
+    email="user1@example.com",
+    created_at=FROZEN_NOW,
+    groups=["admin"],
+    api_keys=[]
+)
+BASE_API_KEY = ApiKey.model_construct(
+    id="key-456",
+    key_hash="hash",
+    name="Test Key",
+    user_id="user-123",
+    created_at=FROZEN_NOW,
+    is_active=True
+)
 
 # Mock the dependencies to avoid database calls in tests
-@pytest.fixture
-def mock_user_service():
-    """Mock UserService for testing."""
-    return Mock()
-
-@pytest.fixture
-def client(mock_user_service):
-    """Create test client with mocked dependencies."""
-    from src.ygo74.fastapi_openai_rag.main import app
-    from src.ygo74.fastapi_openai_rag.interfaces.api.endpoints.users import get_user_service
-
-    # Override the dependency
-    app.dependency_overrides[get_user_service] = lambda: mock_user_service
-    app.dependency_overrides[require_admin_role] = lambda: AuthenticatedUser(id="user1", username="admin", groups=["admin"], type="jwt")  # type: ignore
+@pytest.fixture(scope="module")
+def overridden_user_service(admin_user) -> Mock:
+    """Inject one mocked UserService for the whole module, as an admin user."""
+    service_instance = Mock()
+    app.dependency_overrides[get_user_service] = lambda: service_instance
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield service_instance
 
     # Clean up
-    app.dependency_overrides.clear()
+    app.dependency_overrides.pop(get_user_service, None)
+
+@pytest.fixture
+def mock_user_service(overridden_user_service: Mock):
+    """Mock UserService for testing, reset before each test."""
+    overridden_user_service.reset_mock(return_value=True, side_effect=True)
+    yield overridden_user_service
 
 class TestUserEndpoints:
     """Tests for user endpoints."""
@@ -38,22 +52,13 @@ class TestUserEndpoints:
         """Test successful retrieval of users."""
         # arrange
         users = [
-            User(
-                id="user-1",
-                username="user1",
-                email="user1@example.com",
-                created_at=datetime.now(timezone.utc),
-                groups=["admin"],
-                api_keys=[]
-            ),
-            User(
-                id="user-2",
-                username="user2",
-                email="user2@example.com",
-                created_at=datetime.now(timezone.utc),
-                groups=["user"],
-                api_keys=[]
-            )
+            BASE_USER,
+            BASE_USER.model_copy(update={
+                "id": "user-2",
+                "username": "user2",
+                "email": "user2@example.com",
+                "groups": ["user"]
+            })
         ]
         mock_user_service.get_active_users.return_value = users
 
@@ -63,10 +68,10 @@ class TestUserEndpoints:
         # assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 2
-        assert data[0]["username"] == "user1"
-        assert data[0]["email"] == "user1@example.com"
-        assert data[0]["groups"] == ["admin"]
+        assert [(u["username"], u["email"], u["groups"]) for u in data] == [
+            ("user1", "user1@example.com", ["admin"]),
+            ("user2", "user2@example.com", ["user"])
+        ]
 
     def test_create_user_success(self, client, mock_user_service):
         """Test successful user creation."""
@@ -76,14 +81,13 @@ class TestUserEndpoints:
             "email": "newuser@example.com",
             "groups": ["user"]
         }
-        created_user = User(
-            id="user-123",
-            username="newuser",
-            email="newuser@example.com",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            groups=["user"]
-        )
+        created_user = BASE_USER.model_copy(update={
+            "id": "user-123",
+            "username": "newuser",
+            "email": "newuser@example.com",
+            "updated_at": FROZEN_NOW,
+            "groups": ["user"]
+        })
         mock_user_service.add_or_update_user.return_value = ("created", created_user)
 
         # act
@@ -92,9 +96,7 @@ class TestUserEndpoints:
         # assert
         assert response.status_code == 201
         data = response.json()
-        assert data["username"] == "newuser"
-        assert data["email"] == "newuser@example.com"
-        assert data["groups"] == ["user"]
+        assert {k: data[k] for k in user_data} == user_data
         mock_user_service.add_or_update_user.assert_called_once_with(
             username="newuser",
             email="newuser@example.com",
@@ -119,14 +121,11 @@ class TestUserEndpoints:
         """Test successful user retrieval by ID."""
         # arrange
         user_id = "user-123"
-        user = User(
-            id=user_id,
-            username="testuser",
-            email="test@example.com",
-            created_at=datetime.now(timezone.utc),
-            groups=["admin"],
-            api_keys=[]
-        )
+        user = BASE_USER.model_copy(update={
+            "id": user_id,
+            "username": "testuser",
+            "email": "test@example.com"
+        })
         mock_user_service.get_user_by_id.return_value = user
 
         # act
@@ -135,9 +134,7 @@ class TestUserEndpoints:
         # assert
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == user_id
-        assert data["username"] == "testuser"
-        assert data["email"] == "test@example.com"
+        assert (data["id"], data["username"], data["email"]) == (user_id, "testuser", "test@example.com")
 
     def test_get_user_by_id_not_found(self, client, mock_user_service):
         """Test user retrieval by ID when user doesn't exist."""
@@ -159,14 +156,13 @@ class TestUserEndpoints:
             "email": "updated@example.com",
             "groups": ["admin", "user"]
         }
-        updated_user = User(
-            id=user_id,
-            username="testuser",
-            email="updated@example.com",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            groups=["admin", "user"]
-        )
+        updated_user = BASE_USER.model_copy(update={
+            "id": user_id,
+            "username": "testuser",
+            "email": "updated@example.com",
+            "updated_at": FROZEN_NOW,
+            "groups": ["admin", "user"]
+        })
         mock_user_service.add_or_update_user.return_value = ("updated", updated_user)
 
         # act
@@ -175,8 +171,7 @@ class TestUserEndpoints:
         # assert
         assert response.status_code == 200
         data = response.json()
-        assert data["email"] == "updated@example.com"
-        assert data["groups"] == ["admin", "user"]
+        assert {k: data[k] for k in update_data} == update_data
 
     def test_delete_user_success(self, client, mock_user_service):
         """Test successful user deletion."""
@@ -199,14 +194,7 @@ class TestUserEndpoints:
         api_key_data = {
             "name": "Test Key"
         }
-        api_key = ApiKey(
-            id="key-456",
-            key_hash="hash",
-            name="Test Key",
-            user_id=user_id,
-            created_at=datetime.now(timezone.utc),
-            is_active=True
-        )
+        api_key = BASE_API_KEY.model_copy(update={"user_id": user_id})
         plain_key = "sk-test-key-123"
         mock_user_service.create_api_key.return_value = (plain_key, api_key)
 
@@ -224,8 +212,8 @@ class TestUserEndpoints:
         """Test successful user statistics retrieval."""
         # arrange
         all_users = [
-            User(id="1", username="user1", is_active=True, created_at=datetime.now(timezone.utc), api_keys=[]),
-            User(id="2", username="user2", is_active=False, created_at=datetime.now(timezone.utc), api_keys=[])
+            BASE_USER.model_copy(update={"id": "1", "username": "user1", "is_active": True}),
+            BASE_USER.model_copy(update={"id": "2", "username": "user2", "is_active": False})
         ]
         active_users = [user for user in all_users if user.is_active]
 
@@ -238,67 +226,36 @@ class TestUserEndpoints:
         # assert
         assert response.status_code == 200
         data = response.json()
-        assert data["total_users"] == 2
-        assert data["active_users"] == 1
-        assert data["inactive_users"] == 1
-        assert data["inactive_users"] == 1
+        assert {k: data[k] for k in ("total_users", "active_users", "inactive_users")} == {
+            "total_users": 2,
+            "active_users": 1,
+            "inactive_users": 1
+        }
 
-    def test_add_user_groups_endpoint_success(self, client, mock_user_service):
-        """Add groups to a user returns updated user."""
+    @pytest.mark.parametrize("op,groups,expected_groups,exc,status_code", [
+        ("add", ["admin", "editor"], ["user", "admin", "editor"], None, 200),
+        ("remove", ["editor", "viewer"], ["user"], None, 200),
+        ("add", ["admin"], None, EntityNotFoundError("User", "u-1"), 404),
+        ("remove", ["admin"], None, EntityNotFoundError("User", "u-1"), 404),
+    ])
+    def test_user_groups_endpoint(self, client, mock_user_service, op, groups, expected_groups, exc, status_code):
+        """Add/remove groups returns the updated user, or 404 for a missing user."""
         user_id = "u-1"
-        updated_user = User(
-            id=user_id,
-            username="john",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            is_active=True,
-            groups=["user", "admin", "editor"]
-        )
-        mock_user_service.add_user_groups.return_value = updated_user
-
-        resp = client.post(f"/v1/admin/users/{user_id}/groups/add", json={"groups": ["admin", "editor"]})
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["id"] == user_id
-        assert data["groups"] == ["user", "admin", "editor"]
-        mock_user_service.add_user_groups.assert_called_once_with(user_id, ["admin", "editor"])
-
-    def test_remove_user_groups_endpoint_success(self, client, mock_user_service):
-        """Remove groups from a user returns updated user."""
-        user_id = "u-2"
-        updated_user = User(
-            id=user_id,
-            username="jane",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            is_active=True,
-            groups=["user"]
-        )
-        mock_user_service.remove_user_groups.return_value = updated_user
-
-        resp = client.post(f"/v1/admin/users/{user_id}/groups/remove", json={"groups": ["editor", "viewer"]})
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["id"] == user_id
-        assert data["groups"] == ["user"]
-        mock_user_service.remove_user_groups.assert_called_once_with(user_id, ["editor", "viewer"])
-
-    def test_add_user_groups_endpoint_user_not_found(self, client, mock_user_service):
-        """Adding groups to a missing user returns 404 via endpoint handler."""
-        user_id = "missing"
-        mock_user_service.add_user_groups.side_effect = EntityNotFoundError("User", user_id)
-
-        resp = client.post(f"/v1/admin/users/{user_id}/groups/add", json={"groups": ["admin"]})
-
-        assert resp.status_code == 404
-
-    def test_remove_user_groups_endpoint_user_not_found(self, client, mock_user_service):
-        """Removing groups for a missing user returns 404 via endpoint handler."""
-        user_id = "missing"
-        mock_user_service.remove_user_groups.side_effect = EntityNotFoundError("User", user_id)
-
-        resp = client.post(f"/v1/admin/users/{user_id}/groups/remove", json={"groups": ["admin"]})
-
-        assert resp.status_code == 404
+        service_method = getattr(mock_user_service, f"{op}_user_groups")
+        if exc is None:
+            service_method.return_value = BASE_USER.model_copy(update={
+                "id": user_id,
+                "username": "john",
+                "updated_at": FROZEN_NOW,
+                "groups": expected_groups
+            })
+        else:
+            service_method.side_effect = exc
+
+        resp = client.post(f"/v1/admin/users/{user_id}/groups/{op}", json={"groups": groups})
+
+        assert resp.status_code == status_code
+        service_method.assert_called_once_with(user_id, groups)
+        if exc is None:
+            data = resp.json()
+            assert (data["id"], data["groups"]) == (user_id, expected_groups)
@@ -1,7 +1,9 @@
 """Database initialization script to create initial user and API key."""
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 # Configuration
@@ -9,15 +11,28 @@ BASE_URL = "http://localhost:8000/v1"
 ADMIN_USERNAME = "admin"
 ADMIN_EMAIL = "admin@localhost.com"
 ADMIN_GROUPS = ["admin", "users"]
+# (connect, read) timeouts; an unreachable server fails the first request fast
+REQUEST_TIMEOUT = (2, 30)
+
+# Constant group payloads, serialized once
+ADMIN_GROUP_BODY = json.dumps({
+    "name": "admin",
+    "description": "Administrator group with full access"
+}).encode("utf-8")
+USERS_GROUP_BODY = json.dumps({
+    "name": "users",
+    "description": "Standard users group"
+}).encode("utf-8")
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_user(username: str, email: str, groups: list) -> Optional[Dict[str, Any]]:
+def create_user(session: requests.Session, username: str, email: str, groups: list) -> Optional[Dict[str, Any]]:
     """Create a new user via API.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         username (str): Username
         email (str): Email address
         groups (list): List of groups for the user
@@ -33,29 +48,30 @@ def create_user(username: str, email: str, groups: list) -> Optional[Dict[str, A
     }
 
     try:
-        logger.info(f"Creating user: {username}")
-        response = requests.post(url, json=payload)
+        logger.info("Creating user: %s", username)
+        response = session.post(url, json=payload, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 201:
             user_data = response.json()
-            logger.info(f"User created successfully: ID {user_data['id']}")
+            logger.info("User created successfully: ID %s", user_data['id'])
             return user_data
         elif response.status_code == 409:
-            logger.warning(f"User {username} already exists")
+            logger.warning("User %s already exists", username)
             # Try to get existing user
-            return get_user_by_username(username)
+            return get_user_by_username(session, username)
         else:
-            logger.error(f"Failed to create user: {response.status_code} - {response.text}")
+            logger.error("Failed to create user: %s - %s", response.status_code, response.text)
             return None
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error creating user: {e}")
+        logger.error("Error creating user: %s", e)
         return None
 
-def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
+def get_user_by_username(session: requests.Session, username: str) -> Optional[Dict[str, Any]]:
     """Get user by username via API.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         username (str): Username to search for
 
     Returns:
@@ -64,28 +80,29 @@ def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
     url = f"{BASE_URL}/admin/users/username/{username}"
 
     try:
-        logger.info(f"Getting user by username: {username}")
-        response = requests.get(url)
+        logger.info("Getting user by username: %s", username)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             user_data = response.json()
-            logger.info(f"User found: ID {user_data['id']}")
+            logger.info("User found: ID %s", user_data['id'])
             return user_data
         elif response.status_code == 404:
-            logger.warning(f"User {username} not found")
+            logger.warning("User %s not found", username)
             return None
         else:
-            logger.error(f"Failed to get user: {response.status_code} - {response.text}")
+            logger.error("Failed to get user: %s - %s", response.status_code, response.text)
             return None
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error getting user: {e}")
+        logger.error("Error getting user: %s", e)
         return None
 
-def create_api_key(user_id: str, name: str = "Initial API Key") -> Optional[Dict[str, Any]]:
+def create_api_key(session: requests.Session, user_id: str, name: str = "Initial API Key") -> Optional[Dict[str, Any]]:
     """Create an API key for a user.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         user_id (str): User ID
         name (str): API key name
 
@@ -98,116 +115,127 @@ def create_api_key(user_id: str, name: str = "Initial API Key") -> Optional[Dict
     }
 
     try:
-        logger.info(f"Creating API key for user {user_id}")
-        response = requests.post(url, json=payload)
+        logger.info("Creating API key for user %s", user_id)
+        response = session.post(url, json=payload, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 201:
             api_key_data = response.json()
-            logger.info(f"API key created successfully: {api_key_data['key_info']['id']}")
-            logger.info(f"🔑 API KEY: {api_key_data['api_key']}")
+            logger.info("API key created successfully: %s", api_key_data['key_info']['id'])
+            logger.info("🔑 API KEY: %s", api_key_data['api_key'])
             logger.info("⚠️  Save this API key! It won't be shown again.")
             return api_key_data
         else:
-            logger.error(f"Failed to create API key: {response.status_code} - {response.text}")
+            logger.error("Failed to create API key: %s - %s", response.status_code, response.text)
             return None
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error creating API key: {e}")
+        logger.error("Error creating API key: %s", e)
         return None
 
-def create_admin_group() -> Optional[Dict[str, Any]]:
+def create_admin_group(session: requests.Session) -> Optional[Dict[str, Any]]:
     """Create admin group via API.
 
+    Args:
+        session (requests.Session): HTTP session to send the request with
+
     Returns:
         Optional[Dict[str, Any]]: Group data if successful, None otherwise
     """
     url = f"{BASE_URL}/admin/groups/"
-    payload = {
-        "name": "admin",
-        "description": "Administrator group with full access"
-    }
 
     try:
         logger.info("Creating admin group")
-        response = requests.post(url, json=payload)
+        response = session.post(url, data=ADMIN_GROUP_BODY, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 201:
             group_data = response.json()
-            logger.info(f"Admin group created successfully: ID {group_data['id']}")
+            logger.info("Admin group created successfully: ID %s", group_data['id'])
             return group_data
         elif response.status_code == 409:
             logger.warning("Admin group already exists")
             return {"name": "admin"}  # Return minimal data
         else:
-            logger.error(f"Failed to create admin group: {response.status_code} - {response.text}")
+            logger.error("Failed to create admin group: %s - %s", response.status_code, response.text)
             return None
 
+    except requests.exceptions.ConnectionError:
+        # First request of the run, reported by main() as server not accessible
+        raise
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error creating admin group: {e}")
+        logger.error("Error creating admin group: %s", e)
         return None
 
-def create_users_group() -> Optional[Dict[str, Any]]:
+def create_users_group(session: requests.Session) -> Optional[Dict[str, Any]]:
     """Create users group via API.
 
+    Args:
+        session (requests.Session): HTTP session to send the request with
+
     Returns:
         Optional[Dict[str, Any]]: Group data if successful, None otherwise
     """
     url = f"{BASE_URL}/admin/groups/"
-    payload = {
-        "name": "users",
-        "description": "Standard users group"
-    }
 
     try:
         logger.info("Creating users group")
-        response = requests.post(url, json=payload)
+        response = session.post(url, data=USERS_GROUP_BODY, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 201:
             group_data = response.json()
-            logger.info(f"Users group created successfully: ID {group_data['id']}")
+            logger.info("Users group created successfully: ID %s", group_data['id'])
             return group_data
         elif response.status_code == 409:
             logger.warning("Users group already exists")
             return {"name": "users"}  # Return minimal data
         else:
-            logger.error(f"Failed to create users group: {response.status_code} - {response.text}")
+            logger.error("Failed to create users group: %s - %s", response.status_code, response.text)
             return None
 
+    except requests.exceptions.ConnectionError:
+        # First request of the run, reported by main() as server not accessible
+        raise
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error creating users group: {e}")
+        logger.error("Error creating users group: %s", e)
         return None
 
-def check_server_health() -> bool:
-    """Check if the server is running and accessible.
+def create_session() -> requests.Session:
+    """Create an HTTP session reusing one keep-alive connection for all calls.
 
     Returns:
-        bool: True if server is accessible, False otherwise
+        requests.Session: Session with a pooled adapter for the API server
     """
-    try:
-        response = requests.get(f"http://localhost:8000/health", timeout=5)
-        if response.status_code == 200:
-            logger.info("✅ Server is running and accessible")
-            return True
-        else:
-            logger.error(f"Server responded with status: {response.status_code}")
-            return False
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Server is not accessible: {e}")
-        logger.error("Please make sure the FastAPI server is running on http://localhost:8000")
-        return False
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 def main():
     """Main initialization function."""
     logger.info("🚀 Starting database initialization...")
 
-    # Check server health first
-    if not check_server_health():
-        return
+    with create_session() as session:
+        try:
+            run_initialization(session)
+        except requests.exceptions.ConnectionError as e:
+            logger.error("❌ Server is not accessible: %s", e)
+            logger.error("Please make sure the FastAPI server is running on http://localhost:8000")
+
+def run_initialization(session: requests.Session) -> None:
+    """Run the initialization steps against the API server.
 
+    Args:
+        session (requests.Session): HTTP session to send the requests with
+    """
     # Step 1: Create groups
     logger.info("\n📁 Creating groups...")
-    admin_group = create_admin_group()
-    users_group = create_users_group()
+    # The two groups are independent, create them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        admin_future = executor.submit(create_admin_group, session)
+        users_future = executor.submit(create_users_group, session)
+        admin_group = admin_future.result()
+        users_group = users_future.result()
 
     if not admin_group or not users_group:
         logger.error("❌ Failed to create required groups. Aborting.")
@@ -215,7 +243,7 @@ def main():
 
     # Step 2: Create admin user
     logger.info("\n👤 Creating admin user...")
-    admin_user = create_user(ADMIN_USERNAME, ADMIN_EMAIL, ADMIN_GROUPS)
+    admin_user = create_user(session, ADMIN_USERNAME, ADMIN_EMAIL, ADMIN_GROUPS)
 
     if not admin_user:
         logger.error("❌ Failed to create admin user. Aborting.")
@@ -223,7 +251,7 @@ def main():
 
     # Step 3: Create API key for admin user
     logger.info("\n🔑 Creating API key for admin user...")
-    api_key_data = create_api_key(admin_user['id'], "Admin Initial API Key")
+    api_key_data = create_api_key(session, admin_user['id'], "Admin Initial API Key")
 
     if not api_key_data:
         logger.error("❌ Failed to create API key.")
@@ -232,16 +260,16 @@ def main():
     # Summary
     logger.info("\n✅ Database initialization completed successfully!")
     logger.info("=" * 60)
-    logger.info(f"Admin User ID: {admin_user['id']}")
-    logger.info(f"Admin Username: {admin_user['username']}")
-    logger.info(f"Admin Email: {admin_user['email']}")
-    logger.info(f"Admin Groups: {admin_user['groups']}")
+    logger.info("Admin User ID: %s", admin_user['id'])
+    logger.info("Admin Username: %s", admin_user['username'])
+    logger.info("Admin Email: %s", admin_user['email'])
+    logger.info("Admin Groups: %s", admin_user['groups'])
     logger.info("=" * 60)
     logger.info("🔑 API Key (save this!):")
-    logger.info(f"   {api_key_data['api_key']}")
+    logger.info("   %s", api_key_data['api_key'])
     logger.info("=" * 60)
     logger.info("\nYou can now use this API key to authenticate requests:")
-    logger.info(f'curl -H "Authorization: Bearer {api_key_data["api_key"]}" http://localhost:8000/api/v1/admin/users/')
+    logger.info('curl -H "Authorization: Bearer %s" http://localhost:8000/api/v1/admin/users/', api_key_data["api_key"])
     logger.info("\nOr test with:")
     logger.info("python tools/test_api.py")
 
@@ -3,6 +3,7 @@ import requests
 import subprocess
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any
 
 # Setup logging
@@ -10,27 +11,48 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 KEYCLOAK_URL = "http://localhost:8080"
+# Fail fast on unreachable endpoints, allow slow responses to complete
+PROBE_TIMEOUT = (2, 10)
+COMPOSE_COMMAND = ["docker", "compose", "-f", "docker-compose-backend.yml"]
+
+# Static help blocks, each emitted as a single log record
+STOPPED_TIPS = "\n".join([
+    "1. Start Keycloak: docker compose -f docker-compose-backend.yml up -d",
+    "2. Check if ports are free: netstat -an | findstr :8080",
+    "3. Check Docker: docker ps",
+])
+RUNNING_TIPS = "\n".join([
+    "1. Wait a few more minutes for Keycloak to fully start",
+    "2. Check firewall settings",
+    "3. Try restarting the container: docker compose -f docker-compose-backend.yml restart",
+])
+USEFUL_COMMANDS = "\n".join([
+    "\n📚 Useful Commands:",
+    "- View logs: docker compose -f docker-compose-backend.yml logs -f keycloak",
+    "- Restart: docker compose -f docker-compose-backend.yml restart keycloak",
+    "- Stop/Start: docker compose -f docker-compose-backend.yml down && docker compose -f docker-compose-backend.yml up -d",
+    "- Access admin: http://localhost:8080/admin/ (admin/admin)",
+])
 
 def check_docker_container():
     """Check if Keycloak Docker container is running."""
     try:
         logger.info("🐳 Checking Docker container status...")
+        # Let compose filter on state and list service names, one per line
         result = subprocess.run(
-            ["docker", "compose", "-f", "docker-compose-backend.yml", "ps"],
+            COMPOSE_COMMAND + ["ps", "--status", "running", "--services"],
             capture_output=True,
-            text=True,
-            cwd="."
+            text=True
         )
 
         if result.returncode == 0:
-            output = result.stdout
-            if "keycloak" in output and "Up" in output:
+            running_services = result.stdout.split()
+            if "keycloak" in running_services:
                 logger.info("✅ Keycloak container is running")
                 return True
             else:
                 logger.warning("⚠️  Keycloak container is not running")
-                logger.info("Container status:")
-                logger.info(output)
+                logger.info(f"Running services: {running_services}")
                 return False
         else:
             logger.error(f"❌ Failed to check container status: {result.stderr}")
@@ -48,10 +70,9 @@ def check_keycloak_logs():
     try:
         logger.info("📋 Getting Keycloak logs...")
         result = subprocess.run(
-            ["docker", "compose", "-f", "docker-compose-backend.yml", "logs", "--tail", "20", "keycloak"],
+            COMPOSE_COMMAND + ["logs", "--tail", "20", "keycloak"],
             capture_output=True,
-            text=True,
-            cwd="."
+            text=True
         )
 
         if result.returncode == 0:
@@ -66,6 +87,20 @@ def check_keycloak_logs():
         logger.error(f"❌ Error getting logs: {e}")
         return False
 
+def probe_endpoint(endpoint: str) -> Any:
+    """Send a GET request to an endpoint.
+
+    Args:
+        endpoint (str): URL to probe
+
+    Returns:
+        Any: The response, or the exception raised by the request
+    """
+    try:
+        return requests.get(endpoint, timeout=PROBE_TIMEOUT)
+    except Exception as e:
+        return e
+
 def test_keycloak_endpoints():
     """Test various Keycloak endpoints."""
     endpoints = [
@@ -80,25 +115,45 @@ def test_keycloak_endpoints():
 
     logger.info("🧪 Testing Keycloak endpoints...")
 
-    for endpoint, description in endpoints:
+    # Probes are independent, send them concurrently and report each one
+    # as soon as it completes so hanging endpoints do not hide the others
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {
+            executor.submit(probe_endpoint, endpoint): (endpoint, description)
+            for endpoint, description in endpoints
+        }
+        for future in as_completed(futures):
+            endpoint, description = futures[future]
+            report_endpoint(endpoint, description, future.result())
+
+def report_endpoint(endpoint: str, description: str, result: Any):
+    """Log the outcome of an endpoint probe.
+
+    Args:
+        endpoint (str): Probed URL
+        description (str): Human readable endpoint name
+        result (Any): The response, or the exception raised by the request
+    """
+    if isinstance(result, requests.exceptions.ConnectionError):
+        logger.error(f"❌ {description} ({endpoint}): Connection refused")
+        return
+    if isinstance(result, requests.exceptions.Timeout):
+        logger.error(f"❌ {description} ({endpoint}): Timeout")
+        return
+    if isinstance(result, Exception):
+        logger.error(f"❌ {description} ({endpoint}): {result}")
+        return
+
+    response = result
+    status = "✅" if response.status_code == 200 else "❌"
+    logger.info(f"{status} {description} ({endpoint}): {response.status_code}")
+
+    if response.status_code == 200 and "health" in endpoint:
         try:
-            response = requests.get(endpoint, timeout=10)
-            status = "✅" if response.status_code == 200 else "❌"
-            logger.info(f"{status} {description} ({endpoint}): {response.status_code}")
-
-            if response.status_code == 200 and "health" in endpoint:
-                try:
-                    health_data = response.json()
-                    logger.info(f"   📊 Health data: {health_data}")
-                except:
-                    logger.info("   📊 Health endpoint responded but not JSON")
-
-        except requests.exceptions.ConnectionError:
-            logger.error(f"❌ {description} ({endpoint}): Connection refused")
-        except requests.exceptions.Timeout:
-            logger.error(f"❌ {description} ({endpoint}): Timeout")
-        except Exception as e:
-            logger.error(f"❌ {description} ({endpoint}): {e}")
+            health_data = response.json()
+            logger.info(f"   📊 Health data: {health_data}")
+        except:
+            logger.info("   📊 Health endpoint responded but not JSON")
 
 def test_admin_token():
     """Test getting admin token."""
@@ -153,22 +208,8 @@ def main():
         check_keycloak_logs()
 
     # Step 5: Provide troubleshooting tips
-    logger.info("\n🛠️  Troubleshooting Tips:")
-    if not container_running:
-        logger.info("1. Start Keycloak: docker compose -f docker-compose-backend.yml up -d")
-        logger.info("2. Check if ports are free: netstat -an | findstr :8080")
-        logger.info("3. Check Docker: docker ps")
-    else:
-        logger.info("1. Wait a few more minutes for Keycloak to fully start")
-        logger.info("2. Check firewall settings")
-        logger.info("3. Try restarting the container: docker compose -f docker-compose-backend.yml restart")
-
-    logger.info("\n📚 Useful Commands:")
-    logger.info("- View logs: docker compose -f docker-compose-backend.yml logs -f keycloak")
-    logger.info("- Restart: docker compose -f docker-compose-backend.yml restart keycloak")
-    logger.info("- Stop/Start: docker compose -f docker-compose-backend.yml down && docker compose -f docker-compose-backend.yml up -d")
-    logger.info("- Access admin: http://localhost:8080/admin/ (admin/admin)")
+    logger.info("\n🛠️  Troubleshooting Tips:\n%s", RUNNING_TIPS if container_running else STOPPED_TIPS)
+    logger.info(USEFUL_COMMANDS)
 
 if __name__ == "__main__":
     main()
-    main()
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 BASE_URL = "http://localhost:8000/v1"
 
 def generate_token(
+    session: requests.Session,
     username: str,
     groups: List[str] = None,
     expires_minutes: int = 60,
@@ -20,6 +21,7 @@ def generate_token(
     """Generate a debug JWT token via API.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         username (str): Username for the token
         groups (List[str]): List of groups/roles
         expires_minutes (int): Token expiration in minutes
@@ -39,25 +41,26 @@ def generate_token(
         payload["sub"] = sub
 
     try:
-        logger.info(f"Generating token for user: {username}")
-        response = requests.post(url, json=payload)
+        logger.info("Generating token for user: %s", username)
+        response = session.post(url, json=payload)
 
         if response.status_code == 200:
             token_data = response.json()
             logger.info("✅ Token generated successfully!")
             return token_data
         else:
-            logger.error(f"❌ Failed to generate token: {response.status_code} - {response.text}")
+            logger.error("❌ Failed to generate token: %s - %s", response.status_code, response.text)
             return None
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error generating token: {e}")
+        logger.error("❌ Error generating token: %s", e)
         return None
 
-def test_token(token: str):
+def test_token(session: requests.Session, token: str):
     """Test a JWT token via API.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         token (str): JWT token to test
     """
     headers = {
@@ -68,14 +71,14 @@ def test_token(token: str):
     # Test whoami endpoint
     try:
         logger.info("Testing token with /debug/whoami")
-        response = requests.get(f"{BASE_URL}/debug/whoami", headers=headers)
+        response = session.get(f"{BASE_URL}/debug/whoami", headers=headers)
         if response.status_code == 200:
             user_info = response.json()
-            logger.info(f"✅ Token valid - User: {user_info['username']}, Groups: {user_info['groups']}")
+            logger.info("✅ Token valid - User: %s, Groups: %s", user_info['username'], user_info['groups'])
         else:
-            logger.error(f"❌ Token test failed: {response.status_code}")
+            logger.error("❌ Token test failed: %s", response.status_code)
     except Exception as e:
-        logger.error(f"❌ Error testing token: {e}")
+        logger.error("❌ Error testing token: %s", e)
 
 def main():
     """Main function."""
@@ -91,34 +94,37 @@ def main():
     logger.info("🔑 Debug JWT Token Generator")
     logger.info("=" * 50)
 
-    # Generate token
-    token_data = generate_token(
-        username=args.username,
-        groups=args.groups,
-        expires_minutes=args.expires,
-        sub=args.sub
-    )
-
-    if not token_data:
-        return
-
-    # Display results
-    logger.info("\n📄 Token Details:")
-    logger.info(f"   Username: {token_data['username']}")
-    logger.info(f"   Groups: {token_data['groups']}")
-    logger.info(f"   Expires in: {token_data['expires_in']} seconds")
-    logger.info("\n🔑 JWT Token:")
-    logger.info(f"   {token_data['access_token']}")
-
-    # Test token if requested
-    if args.test:
-        logger.info("\n🧪 Testing token...")
-        test_token(token_data['access_token'])
+    # Generate and test the token over the same keep-alive connection
+    with requests.Session() as session:
+        # Generate token
+        token_data = generate_token(
+            session,
+            username=args.username,
+            groups=args.groups,
+            expires_minutes=args.expires,
+            sub=args.sub
+        )
+
+        if not token_data:
+            return
+
+        # Display results
+        logger.info("\n📄 Token Details:")
+        logger.info("   Username: %s", token_data['username'])
+        logger.info("   Groups: %s", token_data['groups'])
+        logger.info("   Expires in: %s seconds", token_data['expires_in'])
+        logger.info("\n🔑 JWT Token:")
+        logger.info("   %s", token_data['access_token'])
+
+        # Test token if requested
+        if args.test:
+            logger.info("\n🧪 Testing token...")
+            test_token(session, token_data['access_token'])
 
     # Usage examples
     logger.info("\n📚 Usage Examples:")
-    logger.info(f'   curl -H "Authorization: Bearer {token_data["access_token"]}" {BASE_URL}/debug/whoami')
-    logger.info(f'   curl -H "Authorization: Bearer {token_data["access_token"]}" {BASE_URL}/admin/users/')
+    logger.info('   curl -H "Authorization: Bearer %s" %s/debug/whoami', token_data["access_token"], BASE_URL)
+    logger.info('   curl -H "Authorization: Bearer %s" %s/admin/users/', token_data["access_token"], BASE_URL)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,14 @@
 """Setup Keycloak configuration for FastAPI OpenAI RAG application."""
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
+from urllib.parse import quote
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +22,48 @@ REALM_NAME = "fastapi-openai-rag"
 CLIENT_ID = "fastapi-app"
 CLIENT_SECRET = "fastapi-secret-key"
 
+# Static parts of the realm, client and role representations, shared by every request
+REALM_SETTINGS = {
+    "displayName": "FastAPI OpenAI RAG",
+    "enabled": True,
+    "registrationAllowed": True,
+    "loginWithEmailAllowed": True,
+    "duplicateEmailsAllowed": False,
+    "resetPasswordAllowed": True,
+    "editUsernameAllowed": True,
+    "bruteForceProtected": True
+}
+CLIENT_SETTINGS = {
+    "name": "FastAPI Application",
+    "description": "FastAPI OpenAI RAG Application Client",
+    "enabled": True,
+    "clientAuthenticatorType": "client-secret",
+    "redirectUris": ["http://localhost:8000/*"],
+    "webOrigins": ["http://localhost:8000"],
+    "protocol": "openid-connect",
+    "publicClient": False,
+    "bearerOnly": False,
+    "consentRequired": False,
+    "standardFlowEnabled": True,
+    "implicitFlowEnabled": False,
+    "directAccessGrantsEnabled": True,
+    "serviceAccountsEnabled": True,
+    "authorizationServicesEnabled": True,
+    "defaultClientScopes": ["web-origins", "role_list", "profile", "roles", "email"],
+    "optionalClientScopes": ["address", "phone", "offline_access", "microprofile-jwt"]
+}
+ROLE_SETTINGS = {
+    "composite": False
+}
+
+# Upper bound on concurrent admin requests, within the session pool size
+MAX_WORKERS = 8
+
+# Transient admin API failures, e.g. optimistic lock errors under concurrent writes.
+# 409 is left out: it means the entity already exists and is handled by the callers.
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+MAX_ADMIN_ATTEMPTS = 4
+
 # Test users
 TEST_USERS = [
     {
@@ -60,6 +107,20 @@ class KeycloakAdmin:
         self.username = username
         self.password = password
         self.access_token: Optional[str] = None
+        # One pooled keep-alive session for every call to the Keycloak server
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._verbs = {
+            "GET": self._session.get,
+            "POST": self._session.post,
+            "PUT": self._session.put,
+            "DELETE": self._session.delete
+        }
+        # Realm role mappings by role name, loaded once and shared by concurrent role assignments
+        self._role_index: Optional[Dict[str, Dict[str, str]]] = None
+        self._role_index_lock = threading.Lock()
 
     def wait_for_keycloak(self, timeout: int = 60) -> bool:
         """Wait for Keycloak to be ready.
@@ -71,52 +132,27 @@ class KeycloakAdmin:
             bool: True if Keycloak is ready, False otherwise
         """
         logger.info("Waiting for Keycloak to be ready...")
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        delay = 0.25
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
-                # Try the health endpoints on port 8080
-                response = requests.get(f"{self.base_url}/health", timeout=10)
-                if response.status_code == 200:
-                    logger.info("✅ Keycloak health endpoint is accessible!")
-                    return True
-
-                # Try readiness endpoint
-                response = requests.get(f"{self.base_url}/health/ready", timeout=10)
+                # The master realm answers once Keycloak can serve admin calls
+                response = self._session.get(f"{self.base_url}/realms/master", timeout=2)
                 if response.status_code == 200:
-                    logger.info("✅ Keycloak readiness endpoint is accessible!")
+                    logger.info("✅ Keycloak is fully ready!")
                     return True
-
-                # Try liveness endpoint
-                response = requests.get(f"{self.base_url}/health/live", timeout=10)
-                if response.status_code == 200:
-                    logger.info("✅ Keycloak liveness endpoint is accessible!")
-                    return True
-
-                # Fallback to main endpoint
-                response = requests.get(f"{self.base_url}/", timeout=10)
-                if response.status_code == 200:
-                    logger.info("✅ Keycloak main endpoint is accessible!")
-
-                    # Also try the realms endpoint to make sure it's fully ready
-                    try:
-                        realms_response = requests.get(f"{self.base_url}/realms/master", timeout=5)
-                        if realms_response.status_code == 200:
-                            logger.info("✅ Keycloak is fully ready!")
-                            return True
-                    except requests.exceptions.RequestException:
-                        logger.info("⏳ Keycloak starting up, waiting for realms...")
-
             except requests.exceptions.RequestException as e:
-                logger.debug(f"Connection attempt failed: {e}")
+                logger.debug("Connection attempt failed: %s", e)
 
             logger.info("⏳ Waiting for Keycloak...")
-            time.sleep(5)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 3.0)
 
         logger.error("❌ Keycloak is not ready after timeout")
         logger.error("💡 Make sure Keycloak is running with: docker compose -f docker-compose-backend.yml up -d")
         logger.error("💡 Check Keycloak logs with: docker compose -f docker-compose-backend.yml logs keycloak")
-        logger.error("💡 Try manual health check: curl http://localhost:8080/health")
+        logger.error("💡 Try manual readiness check: curl http://localhost:8080/realms/master")
         return False
 
     def get_admin_token(self) -> bool:
@@ -134,7 +170,7 @@ class KeycloakAdmin:
                 "password": self.password
             }
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/realms/master/protocol/openid-connect/token",
                 data=data
             )
@@ -142,19 +178,22 @@ class KeycloakAdmin:
             if response.status_code == 200:
                 token_data = response.json()
                 self.access_token = token_data["access_token"]
+                self._session.headers["Authorization"] = f"Bearer {self.access_token}"
                 logger.info("✅ Admin token obtained successfully")
                 return True
             else:
-                logger.error(f"❌ Failed to get admin token: {response.status_code} - {response.text}")
+                logger.error("❌ Failed to get admin token: %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error getting admin token: {e}")
+            logger.error("❌ Error getting admin token: %s", e)
             return False
 
     def make_admin_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> requests.Response:
         """Make authenticated admin request.
 
+        Transient server errors are retried with jittered exponential backoff.
+
         Args:
             method (str): HTTP method
             endpoint (str): API endpoint
@@ -163,24 +202,22 @@ class KeycloakAdmin:
         Returns:
             requests.Response: Response object
         """
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
         url = f"{self.base_url}/admin/realms{endpoint}"
 
-        if method.upper() == "GET":
-            return requests.get(url, headers=headers)
-        elif method.upper() == "POST":
-            return requests.post(url, headers=headers, json=data)
-        elif method.upper() == "PUT":
-            return requests.put(url, headers=headers, json=data)
-        elif method.upper() == "DELETE":
-            return requests.delete(url, headers=headers)
-        else:
+        send = self._verbs.get(method.upper())
+        if send is None:
             raise ValueError(f"Unsupported method: {method}")
 
+        # The session carries the bearer token, json= sets the content type
+        for attempt in range(MAX_ADMIN_ATTEMPTS):
+            response = send(url, json=data)
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_ADMIN_ATTEMPTS - 1:
+                return response
+
+            delay = random.uniform(0.05, 0.2) * (2 ** attempt)
+            logger.warning("Transient %s from %s %s, retrying in %.2fs", response.status_code, method, endpoint, delay)
+            time.sleep(delay)
+
     def create_realm(self, realm_name: str) -> bool:
         """Create a new realm.
 
@@ -191,37 +228,24 @@ class KeycloakAdmin:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info(f"Creating realm: {realm_name}")
+            logger.info("Creating realm: %s", realm_name)
 
-            # Check if realm already exists
-            response = self.make_admin_request("GET", f"/{realm_name}")
-            if response.status_code == 200:
-                logger.info(f"⚠️  Realm {realm_name} already exists")
-                return True
-
-            realm_data = {
-                "realm": realm_name,
-                "displayName": "FastAPI OpenAI RAG",
-                "enabled": True,
-                "registrationAllowed": True,
-                "loginWithEmailAllowed": True,
-                "duplicateEmailsAllowed": False,
-                "resetPasswordAllowed": True,
-                "editUsernameAllowed": True,
-                "bruteForceProtected": True
-            }
+            realm_data = {"realm": realm_name, **REALM_SETTINGS}
 
             response = self.make_admin_request("POST", "", realm_data)
 
             if response.status_code == 201:
-                logger.info(f"✅ Realm {realm_name} created successfully")
+                logger.info("✅ Realm %s created successfully", realm_name)
+                return True
+            elif response.status_code == 409:
+                logger.info("⚠️  Realm %s already exists", realm_name)
                 return True
             else:
-                logger.error(f"❌ Failed to create realm: {response.status_code} - {response.text}")
+                logger.error("❌ Failed to create realm: %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error creating realm: {e}")
+            logger.error("❌ Error creating realm: %s", e)
             return False
 
     def create_client(self, realm_name: str, client_id: str, client_secret: str) -> bool:
@@ -236,41 +260,24 @@ class KeycloakAdmin:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info(f"Creating client: {client_id}")
+            logger.info("Creating client: %s", client_id)
 
-            client_data = {
-                "clientId": client_id,
-                "name": "FastAPI Application",
-                "description": "FastAPI OpenAI RAG Application Client",
-                "enabled": True,
-                "clientAuthenticatorType": "client-secret",
-                "secret": client_secret,
-                "redirectUris": ["http://localhost:8000/*"],
-                "webOrigins": ["http://localhost:8000"],
-                "protocol": "openid-connect",
-                "publicClient": False,
-                "bearerOnly": False,
-                "consentRequired": False,
-                "standardFlowEnabled": True,
-                "implicitFlowEnabled": False,
-                "directAccessGrantsEnabled": True,
-                "serviceAccountsEnabled": True,
-                "authorizationServicesEnabled": True,
-                "defaultClientScopes": ["web-origins", "role_list", "profile", "roles", "email"],
-                "optionalClientScopes": ["address", "phone", "offline_access", "microprofile-jwt"]
-            }
+            client_data = {"clientId": client_id, "secret": client_secret, **CLIENT_SETTINGS}
 
             response = self.make_admin_request("POST", f"/{realm_name}/clients", client_data)
 
             if response.status_code == 201:
-                logger.info(f"✅ Client {client_id} created successfully")
+                logger.info("✅ Client %s created successfully", client_id)
+                return True
+            elif response.status_code == 409:
+                logger.info("⚠️  Client %s already exists", client_id)
                 return True
             else:
-                logger.error(f"❌ Failed to create client: {response.status_code} - {response.text}")
+                logger.error("❌ Failed to create client: %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error creating client: {e}")
+            logger.error("❌ Error creating client: %s", e)
             return False
 
     def create_realm_roles(self, realm_name: str, roles: List[str]) -> bool:
@@ -284,31 +291,42 @@ class KeycloakAdmin:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info(f"Creating realm roles: {roles}")
+            logger.info("Creating realm roles: %s", roles)
 
-            for role in roles:
-                role_data = {
-                    "name": role,
-                    "description": f"Role for {role} users",
-                    "composite": False
-                }
+            # Roles are independent, create them concurrently
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(roles) or 1)) as executor:
+                results = list(executor.map(lambda role: self._create_realm_role(realm_name, role), roles))
 
-                response = self.make_admin_request("POST", f"/{realm_name}/roles", role_data)
+            return all(results)
 
-                if response.status_code == 201:
-                    logger.info(f"✅ Role {role} created successfully")
-                elif response.status_code == 409:
-                    logger.info(f"⚠️  Role {role} already exists")
-                else:
-                    logger.error(f"❌ Failed to create role {role}: {response.status_code} - {response.text}")
-                    return False
+        except Exception as e:
+            logger.error("❌ Error creating roles: %s", e)
+            return False
 
-            return True
+    def _create_realm_role(self, realm_name: str, role: str) -> bool:
+        """Create a single realm role.
 
-        except Exception as e:
-            logger.error(f"❌ Error creating roles: {e}")
+        Args:
+            realm_name (str): Realm name
+            role (str): Role name
+
+        Returns:
+            bool: True if created or already existing, False otherwise
+        """
+        role_data = {"name": role, "description": f"Role for {role} users", **ROLE_SETTINGS}
+
+        response = self.make_admin_request("POST", f"/{realm_name}/roles", role_data)
+
+        if response.status_code == 201:
+            logger.info("✅ Role %s created successfully", role)
+        elif response.status_code == 409:
+            logger.info("⚠️  Role %s already exists", role)
+        else:
+            logger.error("❌ Failed to create role %s: %s - %s", role, response.status_code, response.text)
             return False
 
+        return True
+
     def create_user(self, realm_name: str, user_data: Dict[str, Any]) -> bool:
         """Create a user in the realm.
 
@@ -321,7 +339,7 @@ class KeycloakAdmin:
         """
         try:
             username = user_data["username"]
-            logger.info(f"Creating user: {username}")
+            logger.info("Creating user: %s", username)
 
             keycloak_user = {
                 "username": username,
@@ -340,7 +358,7 @@ class KeycloakAdmin:
             response = self.make_admin_request("POST", f"/{realm_name}/users", keycloak_user)
 
             if response.status_code == 201:
-                logger.info(f"✅ User {username} created successfully")
+                logger.info("✅ User %s created successfully", username)
 
                 # Get user ID from location header
                 user_id = response.headers["Location"].split("/")[-1]
@@ -348,16 +366,83 @@ class KeycloakAdmin:
                 # Assign roles
                 return self.assign_user_roles(realm_name, user_id, user_data["roles"])
             elif response.status_code == 409:
-                logger.info(f"⚠️  User {username} already exists")
-                return True
+                # Also reached when a retried POST already created the user,
+                # so make sure the roles are assigned either way
+                logger.info("⚠️  User %s already exists", username)
+                user_id = self.find_user_id(realm_name, username)
+                if user_id is None:
+                    return False
+                return self.assign_user_roles(realm_name, user_id, user_data["roles"])
             else:
-                logger.error(f"❌ Failed to create user {username}: {response.status_code} - {response.text}")
+                logger.error("❌ Failed to create user %s: %s - %s", username, response.status_code, response.text)
+                return False
+
+        except Exception as e:
+            logger.error("❌ Error creating user: %s", e)
+            return False
+
+    def find_user_id(self, realm_name: str, username: str) -> Optional[str]:
+        """Find the ID of an existing user.
+
+        Args:
+            realm_name (str): Realm name
+            username (str): Username
+
+        Returns:
+            Optional[str]: User ID, None if the user cannot be found
+        """
+        try:
+            response = self.make_admin_request("GET", f"/{realm_name}/users?username={quote(username)}&exact=true")
+            if response.status_code != 200:
+                logger.error("❌ Failed to look up user %s: %s", username, response.status_code)
+                return None
+
+            users = response.json()
+            if not users:
+                logger.error("❌ User %s not found", username)
+                return None
+            return users[0]["id"]
+
+        except Exception as e:
+            logger.error("❌ Error looking up user: %s", e)
+            return None
+
+    def load_realm_roles(self, realm_name: str) -> bool:
+        """Load the realm roles and index their role mappings by name.
+
+        Args:
+            realm_name (str): Realm name
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            response = self.make_admin_request("GET", f"/{realm_name}/roles")
+            if response.status_code != 200:
+                logger.error("❌ Failed to get realm roles: %s", response.status_code)
                 return False
 
+            self._role_index = {role["name"]: {"id": role["id"], "name": role["name"]} for role in response.json()}
+            return True
+
         except Exception as e:
-            logger.error(f"❌ Error creating user: {e}")
+            logger.error("❌ Error loading realm roles: %s", e)
             return False
 
+    def _get_role_index(self, realm_name: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Get the realm role index, loading it on first use.
+
+        Args:
+            realm_name (str): Realm name
+
+        Returns:
+            Optional[Dict[str, Dict[str, str]]]: Role mappings by name, None if they cannot be loaded
+        """
+        with self._role_index_lock:
+            if self._role_index is None and not self.load_realm_roles(realm_name):
+                return None
+            return self._role_index
+
     def assign_user_roles(self, realm_name: str, user_id: str, roles: List[str]) -> bool:
         """Assign roles to a user.
 
@@ -370,24 +455,14 @@ class KeycloakAdmin:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info(f"Assigning roles {roles} to user {user_id}")
+            logger.info("Assigning roles %s to user %s", roles, user_id)
 
-            # Get available realm roles
-            response = self.make_admin_request("GET", f"/{realm_name}/roles")
-            if response.status_code != 200:
-                logger.error(f"❌ Failed to get realm roles: {response.status_code}")
+            # Realm roles are loaded once for all users
+            role_index = self._get_role_index(realm_name)
+            if role_index is None:
                 return False
 
-            available_roles = response.json()
-            role_mappings = []
-
-            for role_name in roles:
-                role_obj = next((r for r in available_roles if r["name"] == role_name), None)
-                if role_obj:
-                    role_mappings.append({
-                        "id": role_obj["id"],
-                        "name": role_obj["name"]
-                    })
+            role_mappings = [role_index[role_name] for role_name in roles if role_name in role_index]
 
             if role_mappings:
                 response = self.make_admin_request(
@@ -400,13 +475,13 @@ class KeycloakAdmin:
                     logger.info("✅ Roles assigned successfully")
                     return True
                 else:
-                    logger.error(f"❌ Failed to assign roles: {response.status_code} - {response.text}")
+                    logger.error("❌ Failed to assign roles: %s - %s", response.status_code, response.text)
                     return False
 
             return True
 
         except Exception as e:
-            logger.error(f"❌ Error assigning roles: {e}")
+            logger.error("❌ Error assigning roles: %s", e)
             return False
 
 def main():
@@ -437,6 +512,11 @@ def main():
         logger.error("❌ Keycloak setup failed - cannot create roles")
         return
 
+    # Load the roles once for every user role assignment
+    if not admin.load_realm_roles(REALM_NAME):
+        logger.error("❌ Keycloak setup failed - cannot load roles")
+        return
+
     # Step 5: Create client
     if not admin.create_client(REALM_NAME, CLIENT_ID, CLIENT_SECRET):
         logger.error("❌ Keycloak setup failed - cannot create client")
@@ -444,28 +524,27 @@ def main():
 
     # Step 6: Create test users
     logger.info("\n👥 Creating test users...")
-    all_users_created = True
-    for user_data in TEST_USERS:
-        if not admin.create_user(REALM_NAME, user_data):
-            all_users_created = False
+    # Users are independent, create them concurrently over the pooled session
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(TEST_USERS))) as executor:
+        results = list(executor.map(lambda user_data: admin.create_user(REALM_NAME, user_data), TEST_USERS))
 
-    if not all_users_created:
+    if not all(results):
         logger.error("❌ Some users could not be created")
         return
 
     # Success summary
     logger.info("\n✅ Keycloak setup completed successfully!")
     logger.info("=" * 60)
-    logger.info(f"🏰 Realm: {REALM_NAME}")
-    logger.info(f"🔑 Client ID: {CLIENT_ID}")
-    logger.info(f"🔐 Client Secret: {CLIENT_SECRET}")
-    logger.info(f"🌐 Keycloak URL: {KEYCLOAK_URL}")
-    logger.info(f"🔗 Realm URL: {KEYCLOAK_URL}/realms/{REALM_NAME}")
-    logger.info(f"🔗 Admin Console: {KEYCLOAK_URL}/admin/")
+    logger.info("🏰 Realm: %s", REALM_NAME)
+    logger.info("🔑 Client ID: %s", CLIENT_ID)
+    logger.info("🔐 Client Secret: %s", CLIENT_SECRET)
+    logger.info("🌐 Keycloak URL: %s", KEYCLOAK_URL)
+    logger.info("🔗 Realm URL: %s/realms/%s", KEYCLOAK_URL, REALM_NAME)
+    logger.info("🔗 Admin Console: %s/admin/", KEYCLOAK_URL)
 
     logger.info("\n👥 Test Users Created:")
     for user in TEST_USERS:
-        logger.info(f"   Username: {user['username']} | Password: {user['password']} | Roles: {user['roles']}")
+        logger.info("   Username: %s | Password: %s | Roles: %s", user['username'], user['password'], user['roles'])
 
     logger.info("\n📚 Next Steps:")
     logger.info("1. Update your FastAPI configuration with the client credentials")
@@ -473,14 +552,14 @@ def main():
     logger.info("3. Use the JWT tokens for API access")
 
     # Generate sample JWT request
-    logger.info(f"\n🧪 Test token generation:")
-    logger.info(f"curl -X POST '{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token' \\")
-    logger.info(f"  -H 'Content-Type: application/x-www-form-urlencoded' \\")
-    logger.info(f"  -d 'client_id={CLIENT_ID}' \\")
-    logger.info(f"  -d 'client_secret={CLIENT_SECRET}' \\")
-    logger.info(f"  -d 'grant_type=password' \\")
-    logger.info(f"  -d 'username=admin_user' \\")
-    logger.info(f"  -d 'password=admin123'")
+    logger.info("\n🧪 Test token generation:")
+    logger.info("curl -X POST '%s/realms/%s/protocol/openid-connect/token' \\", KEYCLOAK_URL, REALM_NAME)
+    logger.info("  -H 'Content-Type: application/x-www-form-urlencoded' \\")
+    logger.info("  -d 'client_id=%s' \\", CLIENT_ID)
+    logger.info("  -d 'client_secret=%s' \\", CLIENT_SECRET)
+    logger.info("  -d 'grant_type=password' \\")
+    logger.info("  -d 'username=admin_user' \\")
+    logger.info("  -d 'password=admin123'")
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,11 @@
 """Test and debug JWT tokens."""
 import requests
+import base64
+import hashlib
+import hmac
 import json
 import sys
-from jose import jwt, JWTError, ExpiredSignatureError
+import time
 from datetime import datetime
 import logging
 from fastapi import HTTPException
@@ -14,33 +17,113 @@ logger = logging.getLogger(__name__)
 BASE_URL = "http://localhost:8000/v1"
 JWT_SECRET = "SECRET_JWT"  # Same as in auth.py
 JWT_ALGO = "HS256"
+JWT_AUDIENCE = "fastapi-openai-rag"
+JWT_ISSUER = "fastapi-openai-rag-debug"
+# Keyed once; each verification works on a copy
+_HS256_TEMPLATE = hmac.new(JWT_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
 
-def decode_token_locally(token: str):
-    """Decode JWT token locally for debugging."""
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+def _split_token(token: str) -> tuple:
+    """Split a JWT into its header, payload and signature segments.
+
+    Raises:
+        ValueError: If the token does not have three segments
+    """
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+    except ValueError:
+        raise ValueError("Token must have three dot-separated segments")
+    return header_segment, payload_segment, signature_segment
+
+def peek_token_payload(token: str) -> dict:
+    """Decode the JWT payload segment without verifying the signature.
+
+    Args:
+        token (str): JWT token
+
+    Returns:
+        dict: Token claims
+
+    Raises:
+        ValueError: If the token is not a well-formed JWT
+    """
+    _, payload_segment, _ = _split_token(token)
+    return json.loads(_b64url_decode(payload_segment))
+
+def verify_hs256_token(token: str) -> dict:
+    """Verify an HS256 token signature and expiry with hmac.
+
+    Audience and issuer mismatches are reported but accepted.
+
+    Args:
+        token (str): JWT token signed with JWT_SECRET
+
+    Returns:
+        dict: Verified token claims
+
+    Raises:
+        HTTPException: If the signature does not match or the token is expired
+        ValueError: If the token is not a well-formed JWT
+    """
+    header_segment, payload_segment, signature_segment = _split_token(token)
+    signing_input = f"{header_segment}.{payload_segment}".encode("ascii")
+    signer = _HS256_TEMPLATE.copy()
+    signer.update(signing_input)
+    expected_signature = signer.digest()
+    if not hmac.compare_digest(expected_signature, _b64url_decode(signature_segment)):
+        logger.warning("Invalid JWT token: signature verification failed")
+        raise HTTPException(status_code=401, detail="Invalid JWT token")
+
+    payload = json.loads(_b64url_decode(payload_segment))
+    if "exp" in payload and payload["exp"] < time.time():
+        logger.warning("JWT token has expired")
+        raise HTTPException(status_code=401, detail="Token expired")
+
+    audience = payload.get("aud")
+    audiences = audience if isinstance(audience, list) else [audience]
+    if JWT_AUDIENCE not in audiences or payload.get("iss") != JWT_ISSUER:
+        print(f"⚠️  Audience/issuer do not match {JWT_AUDIENCE}/{JWT_ISSUER}, accepted without validation")
+
+    return payload
+
+def verify_token(token: str) -> dict:
+    """Verify the token signature and claims.
+
+    Only HS256 debug tokens signed with JWT_SECRET can be verified here;
+    tokens using another algorithm are rejected.
+
+    Args:
+        token (str): JWT token
+
+    Returns:
+        dict: Verified token claims
+
+    Raises:
+        HTTPException: If the token is expired, invalid or not HS256
+    """
+    header_segment, _, _ = _split_token(token)
+    algorithm = json.loads(_b64url_decode(header_segment)).get("alg")
+    if algorithm != JWT_ALGO:
+        logger.warning("Cannot verify %s token, only %s debug tokens are supported", algorithm, JWT_ALGO)
+        raise HTTPException(status_code=401, detail=f"Unsupported JWT algorithm {algorithm}, expected {JWT_ALGO}")
+    return verify_hs256_token(token)
+
+def decode_token_locally(token: str, verify: bool = False):
+    """Decode JWT token locally for debugging.
+
+    Args:
+        token (str): JWT token
+        verify (bool): Verify the signature and claims instead of only decoding the payload
+    """
     try:
         print(f"🔍 Decoding token: {token[:20]}...")
 
-        # Try with audience and issuer first
-        try:
-            payload = jwt.decode(
-                token,
-                JWT_SECRET,
-                algorithms=[JWT_ALGO],
-                audience="fastapi-openai-rag",
-                issuer="fastapi-openai-rag-debug"
-            )
-        except JWTError as e:
-            print(f"⚠️  Failed with audience/issuer validation: {e}")
-            print("🔄 Trying without audience/issuer validation...")
-            # Fallback without audience/issuer validation
-            payload = jwt.decode(
-                token,
-                JWT_SECRET,
-                algorithms=[JWT_ALGO],
-                options={"verify_aud": False, "verify_iss": False}
-            )
-
-        print("✅ Token decoded successfully!")
+        payload = verify_token(token) if verify else peek_token_payload(token)
+
+        print("✅ Token decoded successfully!" if verify else "✅ Token decoded (signature not verified)")
         print(f"📄 Payload: {json.dumps(payload, indent=2)}")
 
         # Check expiration
@@ -55,10 +138,10 @@ def decode_token_locally(token: str):
                 print("❌ Token is expired!")
 
         return payload
-    except ExpiredSignatureError:
-        logger.warning("JWT token has expired")
-        raise HTTPException(status_code=401, detail="Token expired")
-    except JWTError as e:
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # Malformed segments, invalid base64 or JSON payload
         logger.warning(f"Invalid JWT token: {e}")
         raise HTTPException(status_code=401, detail="Invalid JWT token")
     except Exception as e:
@@ -87,19 +170,24 @@ def test_token_with_api(token: str):
 
 def main():
     """Main function."""
-    if len(sys.argv) != 2:
-        print("Usage: python tools/test_jwt_debug.py <jwt_token>")
+    args = sys.argv[1:]
+    verify = "--verify" in args
+    if verify:
+        args.remove("--verify")
+    if len(args) != 1:
+        print("Usage: python tools/test_jwt_debug.py <jwt_token> [--verify]")
+        print("\n  --verify  Check the signature and claims (HS256 debug tokens only)")
         print("\nExample:")
         print("python tools/test_jwt_debug.py eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...")
         return
 
-    token = sys.argv[1]
+    token = args[0]
 
     print("🔧 JWT Token Debugger")
     print("=" * 50)
 
     # Test local decoding
-    payload = decode_token_locally(token)
+    payload = decode_token_locally(token, verify=verify)
 
     if payload:
         # Test with API
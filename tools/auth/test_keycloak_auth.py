@@ -1,9 +1,13 @@
 """Test Keycloak authentication and token generation."""
+import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
 import argparse
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -15,11 +19,32 @@ REALM_NAME = "fastapi-openai-rag"
 CLIENT_ID = "fastapi-app"
 CLIENT_SECRET = "fastapi-secret-key"
 FASTAPI_URL = "http://localhost:8000/v1"
+TOKEN_URL = f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token"
+# Connect and read timeouts so an unreachable Keycloak cannot hang the script
+TOKEN_TIMEOUT = (3.05, 10)
+BASE_HEADERS = {"Content-Type": "application/json"}
+RETRY_STATUS_CODES = (502, 503, 504)
+MAX_WORKERS = 8
 
-def get_access_token(username: str, password: str) -> Optional[Dict[str, Any]]:
+def create_session() -> requests.Session:
+    """Create an HTTP session shared by the Keycloak and FastAPI calls.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying adapter
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "kc-test/1.0"})
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUS_CODES)
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_access_token(session: requests.Session, username: str, password: str) -> Optional[Dict[str, Any]]:
     """Get access token from Keycloak.
 
     Args:
+        session (requests.Session): HTTP session to send the request with
         username (str): Username
         password (str): Password
 
@@ -27,7 +52,7 @@ def get_access_token(username: str, password: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Token data if successful, None otherwise
     """
     try:
-        logger.info(f"Getting access token for user: {username}")
+        logger.info("Getting access token for user: %s", username)
 
         data = {
             "client_id": CLIENT_ID,
@@ -37,56 +62,80 @@ def get_access_token(username: str, password: str) -> Optional[Dict[str, Any]]:
             "password": password
         }
 
-        response = requests.post(
-            f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token",
-            data=data
-        )
+        response = session.post(TOKEN_URL, data=data, timeout=TOKEN_TIMEOUT)
 
         if response.status_code == 200:
             token_data = response.json()
             logger.info("✅ Access token obtained successfully")
-            logger.info(f"   Token type: {token_data.get('token_type')}")
-            logger.info(f"   Expires in: {token_data.get('expires_in')} seconds")
+            logger.info("   Token type: %s", token_data.get('token_type'))
+            logger.info("   Expires in: %s seconds", token_data.get('expires_in'))
             return token_data
         else:
-            logger.error(f"❌ Failed to get token: {response.status_code} - {response.text}")
+            logger.error("❌ Failed to get token: %s - %s", response.status_code, response.text)
             return None
 
     except Exception as e:
-        logger.error(f"❌ Error getting token: {e}")
+        logger.error("❌ Error getting token: %s", e)
         return None
 
-def test_fastapi_endpoint(token: str, endpoint: str = "/debug/whoami") -> bool:
-    """Test FastAPI endpoint with Keycloak token.
+def fetch_endpoint(session: requests.Session, headers: Dict[str, str], endpoint: str) -> Any:
+    """Send a GET request to a FastAPI endpoint.
 
     Args:
-        token (str): Access token
-        endpoint (str): Endpoint to test
+        session (requests.Session): HTTP session to send the request with
+        headers (Dict[str, str]): Request headers
+        endpoint (str): Endpoint to fetch
 
     Returns:
-        bool: True if successful, False otherwise
+        Any: The response, or the exception raised by the request
     """
     try:
-        logger.info(f"Testing FastAPI endpoint: {endpoint}")
+        return session.get(f"{FASTAPI_URL}{endpoint}", headers=headers)
+    except Exception as e:
+        return e
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+def test_fastapi_endpoints(session: requests.Session, token: str, endpoints: List[str]) -> bool:
+    """Test FastAPI endpoints with Keycloak token.
+
+    Args:
+        session (requests.Session): HTTP session to send the requests with
+        token (str): Access token
+        endpoints (List[str]): Endpoints to test
+
+    Returns:
+        bool: True if every endpoint succeeded, False otherwise
+    """
+    headers = {**BASE_HEADERS, "Authorization": f"Bearer {token}"}
 
-        response = requests.get(f"{FASTAPI_URL}{endpoint}", headers=headers)
+    # Requests are independent, send them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(endpoints))) as executor:
+        results = list(executor.map(lambda endpoint: fetch_endpoint(session, headers, endpoint), endpoints))
 
+    success = True
+    for endpoint, result in zip(endpoints, results):
+        logger.info("Testing FastAPI endpoint: %s", endpoint)
+
+        if isinstance(result, Exception):
+            logger.error("❌ Error testing FastAPI endpoint: %s", result)
+            success = False
+            continue
+
+        response = result
         if response.status_code == 200:
             logger.info("✅ FastAPI endpoint test successful")
-            logger.info(f"   Response: {json.dumps(response.json(), indent=2)}")
-            return True
+            try:
+                logger.info("   Response: %s", json.dumps(response.json(), indent=2))
+            except ValueError:
+                logger.info("   Response: %s", response.text)
         else:
-            logger.error(f"❌ FastAPI endpoint test failed: {response.status_code} - {response.text}")
-            return False
+            logger.error("❌ FastAPI endpoint test failed: %s - %s", response.status_code, response.text)
+            success = False
 
-    except Exception as e:
-        logger.error(f"❌ Error testing FastAPI endpoint: {e}")
-        return False
+    return success
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
 
 def decode_token_info(token: str):
     """Display token information without validation.
@@ -94,9 +143,11 @@ def decode_token_info(token: str):
     Args:
         token (str): JWT token
     """
-    try:
-        import base64
+    # Nothing would be displayed, skip decoding the token altogether
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
+    try:
         # Split token parts
         parts = token.split(".")
         if len(parts) != 3:
@@ -104,30 +155,30 @@ def decode_token_info(token: str):
             return
 
         # Decode header
-        header = json.loads(base64.b64decode(parts[0] + "=="))
+        header = json.loads(_b64url_decode(parts[0]))
 
         # Decode payload
-        payload = json.loads(base64.b64decode(parts[1] + "=="))
+        payload = json.loads(_b64url_decode(parts[1]))
 
         logger.info("🔍 Token Information:")
-        logger.info(f"   Algorithm: {header.get('alg')}")
-        logger.info(f"   Type: {header.get('typ')}")
-        logger.info(f"   Subject: {payload.get('sub')}")
-        logger.info(f"   Username: {payload.get('preferred_username')}")
-        logger.info(f"   Email: {payload.get('email')}")
-        logger.info(f"   Realm Roles: {payload.get('realm_access', {}).get('roles', [])}")
-        logger.info(f"   Audience: {payload.get('aud')}")
-        logger.info(f"   Issuer: {payload.get('iss')}")
+        logger.info("   Algorithm: %s", header.get('alg'))
+        logger.info("   Type: %s", header.get('typ'))
+        logger.info("   Subject: %s", payload.get('sub'))
+        logger.info("   Username: %s", payload.get('preferred_username'))
+        logger.info("   Email: %s", payload.get('email'))
+        logger.info("   Realm Roles: %s", payload.get('realm_access', {}).get('roles', []))
+        logger.info("   Audience: %s", payload.get('aud'))
+        logger.info("   Issuer: %s", payload.get('iss'))
 
     except Exception as e:
-        logger.error(f"❌ Error decoding token: {e}")
+        logger.error("❌ Error decoding token: %s", e)
 
 def main():
     """Main test function."""
     parser = argparse.ArgumentParser(description="Test Keycloak authentication")
     parser.add_argument("--username", default="admin_user", help="Username (default: admin_user)")
     parser.add_argument("--password", default="admin123", help="Password (default: admin123)")
-    parser.add_argument("--endpoint", default="/debug/whoami", help="FastAPI endpoint to test")
+    parser.add_argument("--endpoint", nargs="+", default=["/debug/whoami"], help="FastAPI endpoint(s) to test")
     parser.add_argument("--no-test", action="store_true", help="Skip FastAPI endpoint test")
 
     args = parser.parse_args()
@@ -135,8 +186,18 @@ def main():
     logger.info("🔐 Keycloak Authentication Test")
     logger.info("=" * 50)
 
+    with create_session() as session:
+        run_tests(session, args)
+
+def run_tests(session: requests.Session, args: argparse.Namespace):
+    """Run the authentication steps over a shared session.
+
+    Args:
+        session (requests.Session): HTTP session reused by every call
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Step 1: Get access token
-    token_data = get_access_token(args.username, args.password)
+    token_data = get_access_token(session, args.username, args.password)
     if not token_data:
         return
 
@@ -149,13 +210,16 @@ def main():
     # Step 3: Test FastAPI endpoint
     if not args.no_test:
         logger.info("\n🧪 Testing FastAPI Integration:")
-        test_fastapi_endpoint(access_token, args.endpoint)
+        test_fastapi_endpoints(session, access_token, args.endpoint)
 
     # Step 4: Display usage examples
-    logger.info("\n📚 Usage Examples:")
-    logger.info("Test other endpoints:")
-    logger.info(f'curl -H "Authorization: Bearer {access_token[:20]}..." {FASTAPI_URL}/admin/users/')
-    logger.info(f'curl -H "Authorization: Bearer {access_token[:20]}..." {FASTAPI_URL}/admin/groups/')
+    logger.info(
+        "\n📚 Usage Examples:\n"
+        "Test other endpoints:\n"
+        'curl -H "Authorization: Bearer %s..." %s/admin/users/\n'
+        'curl -H "Authorization: Bearer %s..." %s/admin/groups/',
+        access_token[:20], FASTAPI_URL, access_token[:20], FASTAPI_URL
+    )
 
 if __name__ == "__main__":
     main()
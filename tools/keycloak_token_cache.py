@@ -0,0 +1,160 @@
+"""
+Keycloak access tokens for the proxy tool scripts, cached on disk.
+
+Shared by the openai, langchain and streaming scripts so a token obtained by
+one of them is reused by the others until it nears expiry.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+KEYCLOAK_URL = "http://localhost:8080"
+REALM_NAME = "fastapi-openai-rag"
+CLIENT_ID = "fastapi-app"
+CLIENT_SECRET = "fastapi-secret-key"
+TOKEN_URL = f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token"
+# Connect and read timeouts so an unreachable Keycloak cannot hang the script
+TOKEN_TIMEOUT = (3.05, 10)
+TOKEN_CACHE_DIR = Path.home() / ".cache" / "openai_proxy"
+# Renew tokens slightly before they expire to absorb clock skew and latency
+TOKEN_EXPIRY_MARGIN = 30
+
+def _token_cache_path(username: str, password: str) -> Path:
+    """Get the cache file holding the tokens issued for a set of credentials.
+
+    Args:
+        username (str): Username
+        password (str): Password, so other credentials never reuse the entry
+
+    Returns:
+        Path: Cache file, keyed on the Keycloak client and the credentials
+    """
+    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
+    key = f"{KEYCLOAK_URL}|{REALM_NAME}|{CLIENT_ID}|{username}|{password_hash}"
+    return TOKEN_CACHE_DIR / f"token-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+def _load_cached_token(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load cached token data, ignoring missing or corrupt files."""
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_token(cache_path: Path, token_data: Dict[str, Any]) -> None:
+    """Atomically write token data to the cache, readable by the owner only."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(token_data, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("⚠️  Could not cache access token: %s", e)
+
+def _is_still_valid(token_data: Dict[str, Any], lifetime_field: str) -> bool:
+    """Check whether a cached token stays valid past the expiry margin."""
+    lifetime = token_data.get(lifetime_field) or 0
+    return time.time() < token_data.get("issued_at", 0) + lifetime - TOKEN_EXPIRY_MARGIN
+
+def _jwt_claims(token: str) -> Dict[str, Any]:
+    """Read the claims of a JWT without verifying it, the proxy does that."""
+    try:
+        payload_segment = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4)))
+    except (IndexError, ValueError):
+        return {}
+
+def _is_access_token_usable(token_data: Dict[str, Any]) -> bool:
+    """Check a cached access token against its lifetime and its own exp/nbf claims."""
+    if not _is_still_valid(token_data, "expires_in"):
+        return False
+    claims = _jwt_claims(token_data.get("access_token", ""))
+    now = time.time()
+    if "exp" in claims and now >= claims["exp"] - TOKEN_EXPIRY_MARGIN:
+        return False
+    return claims.get("nbf", 0) <= now
+
+def _request_token(session: requests.Session, data: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Send a grant to the Keycloak token endpoint.
+
+    Args:
+        session (requests.Session): HTTP session to send the request with
+        data (Dict[str, str]): Grant form fields
+
+    Returns:
+        Optional[Dict[str, Any]]: Token data if successful, None otherwise
+    """
+    issued_at = time.time()
+    response = session.post(TOKEN_URL, data=data, timeout=TOKEN_TIMEOUT)
+
+    if response.status_code == 200:
+        token_data = response.json()
+        token_data["issued_at"] = issued_at
+        logger.info("✅ Access token obtained successfully")
+        logger.info("   Token type: %s", token_data.get('token_type'))
+        logger.info("   Expires in: %s seconds", token_data.get('expires_in'))
+        return token_data
+    else:
+        logger.error("❌ Failed to get token: %s - %s", response.status_code, response.text)
+        return None
+
+def get_access_token(session: requests.Session, username: str, password: str) -> Optional[Dict[str, Any]]:
+    """Get access token from Keycloak.
+
+    Tokens are cached on disk: a cached access token is reused until it
+    nears expiry, then renewed with the refresh token when possible.
+
+    Args:
+        session (requests.Session): HTTP session reused by the grants
+        username (str): Username
+        password (str): Password
+
+    Returns:
+        Optional[Dict[str, Any]]: Token data if successful, None otherwise
+    """
+    try:
+        cache_path = _token_cache_path(username, password)
+        cached = _load_cached_token(cache_path)
+
+        if cached and _is_access_token_usable(cached):
+            logger.info("Using cached access token for user: %s", username)
+            return cached
+
+        token_data = None
+        if cached and cached.get("refresh_token") and _is_still_valid(cached, "refresh_expires_in"):
+            logger.info("Refreshing access token for user: %s", username)
+            token_data = _request_token(session, {
+                "client_id": CLIENT_ID,
+                "client_secret": CLIENT_SECRET,
+                "grant_type": "refresh_token",
+                "refresh_token": cached["refresh_token"]
+            })
+
+        if token_data is None:
+            logger.info("Getting access token for user: %s", username)
+            token_data = _request_token(session, {
+                "client_id": CLIENT_ID,
+                "client_secret": CLIENT_SECRET,
+                "grant_type": "password",
+                "username": username,
+                "password": password
+            })
+
+        if token_data is not None:
+            _save_cached_token(cache_path, token_data)
+        return token_data
+
+    except Exception as e:
+        logger.error("❌ Error getting token: %s", e)
+        raise
@@ -1,13 +1,15 @@
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.tools import tool
 import logging
 import argparse
-from typing import Dict, Any, Optional
+import os
+import sys
+from pathlib import Path
 import requests
 import json
 from pydantic import BaseModel
 
+# Shared helpers live in tools/, one level up from this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from keycloak_token_cache import get_access_token
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -17,53 +19,6 @@ system_prompt= """
 You are an expert in AI solution and you help your colleague to implement AI solutions
 """
 
-# Configuration
-KEYCLOAK_URL = "http://localhost:8080"
-REALM_NAME = "fastapi-openai-rag"
-CLIENT_ID = "fastapi-app"
-CLIENT_SECRET = "fastapi-secret-key"
-
-def get_access_token(username: str, password: str) -> Optional[Dict[str, Any]]:
-    """Get access token from Keycloak.
-
-    Args:
-        username (str): Username
-        password (str): Password
-
-    Returns:
-        Optional[Dict[str, Any]]: Token data if successful, None otherwise
-    """
-    try:
-        logger.info(f"Getting access token for user: {username}")
-
-        data = {
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "grant_type": "password",
-            "username": username,
-            "password": password
-        }
-
-        response = requests.post(
-            f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token",
-            data=data
-        )
-
-        if response.status_code == 200:
-            token_data = response.json()
-            logger.info("✅ Access token obtained successfully")
-            logger.info(f"   Token type: {token_data.get('token_type')}")
-            logger.info(f"   Expires in: {token_data.get('expires_in')} seconds")
-            return token_data
-        else:
-            logger.error(f"❌ Failed to get token: {response.status_code} - {response.text}")
-            return None
-
-    except Exception as e:
-        logger.error(f"❌ Error getting token: {e}")
-        raise
-
-@tool
 def get_weather(location: str) -> str:
     """Get weather at a location."""
     print("=" * 60)
@@ -91,7 +46,11 @@ def main():
 
 
     # Get access token
-    token_data = get_access_token("admin_user", "admin123")
+    try:
+        with requests.Session() as session:
+            token_data = get_access_token(session, "admin_user", "admin123")
+    except requests.RequestException:
+        token_data = None
     if token_data is None:
         print("Failed to get access token. Exiting.")
         return
@@ -101,10 +60,14 @@ def main():
     # Initialize model
     print("Initialize llm")
 
+    # LangChain is imported only once a token is available, so --help and
+    # authentication failures do not pay its import cost
+    from langchain_openai import ChatOpenAI
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.tools import tool
+
     # Pour plus de transparence, activons le débogage HTTP de Langchain
-    import os
     import httpx
-    import json
 
     # Activer le débogage Langchain - Update to use V2 tracing
     os.environ["LANGCHAIN_VERBOSE"] = "false"
@@ -116,7 +79,9 @@ def main():
     # Créer un client HTTP standard avec le token d'authentification
     debug_client = httpx.Client(
         headers={"Authorization": f"Bearer {access_token}"},
-        timeout=httpx.Timeout(timeout=None)
+        # No read timeout for long streamed answers, but bound the rest
+        timeout=httpx.Timeout(connect=10.0, read=None, write=30.0, pool=5.0),
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=60.0)
     )
 
     # Fonction de rappel pour enregistrer les requêtes et réponses
@@ -148,7 +113,7 @@ def main():
     print(f"Configured LLM with streaming={args.stream}")
 
     structured_llm = llm.bind_tools(
-        [get_weather],
+        [tool(get_weather)],
         # response_format=OutputSchema,
         strict=True,
     )
@@ -8,66 +8,36 @@ import logging
 import json
 import time
 import sys
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, TYPE_CHECKING
 import requests
-from openai import OpenAI
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Shared helpers live in tools/, one level up from this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from keycloak_token_cache import get_access_token
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configuration
-KEYCLOAK_URL = "http://localhost:8080"
-REALM_NAME = "fastapi-openai-rag"
-CLIENT_ID = "fastapi-app"
-CLIENT_SECRET = "fastapi-secret-key"
+# Streamed output is flushed once this many characters are pending, or
+# after this many seconds, whichever comes first
+STREAM_FLUSH_CHARS = 512
+STREAM_FLUSH_INTERVAL = 0.05
+# Concurrent completions sent for --questions-file
+MAX_WORKERS = 8
 
 # Prompt système par défaut
 DEFAULT_SYSTEM_PROMPT = """
 You are an expert in AI solution and you help your colleague to implement AI solutions
 """
 
-def get_access_token(username: str, password: str) -> Optional[Dict[str, Any]]:
-    """Get access token from Keycloak.
-
-    Args:
-        username (str): Username
-        password (str): Password
-
-    Returns:
-        Optional[Dict[str, Any]]: Token data if successful, None otherwise
-    """
-    try:
-        logger.info(f"Getting access token for user: {username}")
-
-        data = {
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "grant_type": "password",
-            "username": username,
-            "password": password
-        }
-
-        response = requests.post(
-            f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token",
-            data=data
-        )
-
-        if response.status_code == 200:
-            token_data = response.json()
-            logger.info("✅ Access token obtained successfully")
-            logger.info(f"   Token type: {token_data.get('token_type')}")
-            logger.info(f"   Expires in: {token_data.get('expires_in')} seconds")
-            return token_data
-        else:
-            logger.error(f"❌ Failed to get token: {response.status_code} - {response.text}")
-            return None
-
-    except Exception as e:
-        logger.error(f"❌ Error getting token: {e}")
-        raise
-
-def create_openai_client(base_url: str, bearer_token: str) -> OpenAI:
+def create_openai_client(base_url: str, bearer_token: str) -> "OpenAI":
     """Create an OpenAI client with custom base URL and bearer token.
 
     Args:
@@ -77,12 +47,15 @@ def create_openai_client(base_url: str, bearer_token: str) -> OpenAI:
     Returns:
         OpenAI: Configured OpenAI client
     """
+    # Imported lazily so --help and token errors skip the SDK import cost
+    from openai import OpenAI
+
     return OpenAI(
         api_key=bearer_token,  # La clé API est utilisée comme token
         base_url=base_url
     )
 
-def invoke_chat_completion(client: OpenAI, model: str, messages: list, stream: bool = False, temperature: float = 0):
+def invoke_chat_completion(client: "OpenAI", model: str, messages: list, stream: bool = False, temperature: float = 0):
     """Invoke chat completion with OpenAI client.
 
     Args:
@@ -95,8 +68,9 @@ def invoke_chat_completion(client: OpenAI, model: str, messages: list, stream: b
     Returns:
         Union[str, Generator]: Response text or stream
     """
-    logger.info(f"Invoking chat completion with model: {model}")
-    logger.debug(f"Messages: {json.dumps(messages)}")
+    logger.info("Invoking chat completion with model: %s", model)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Messages: %s", json.dumps(messages))
 
     start_time = time.time()
 
@@ -121,14 +95,36 @@ def invoke_chat_completion(client: OpenAI, model: str, messages: list, stream: b
             )
 
             execution_time = time.time() - start_time
-            logger.info(f"Completion received in {execution_time:.2f}s")
+            logger.info("Completion received in %.2fs", execution_time)
 
             return response.choices[0].message.content
 
     except Exception as e:
-        logger.error(f"Error during chat completion: {e}", exc_info=True)
+        logger.error("Error during chat completion: %s", e, exc_info=True)
         raise
 
+def answer_questions(client: "OpenAI", model: str, system_prompt: str, questions: List[str]) -> List[str]:
+    """Answer several questions with concurrent chat completions.
+
+    Args:
+        client (OpenAI): OpenAI client
+        model (str): Model name
+        system_prompt (str): System prompt shared by every question
+        questions (List[str]): Questions to ask
+
+    Returns:
+        List[str]: Answers, in the same order as the questions
+    """
+    def answer(question: str) -> str:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": question}
+        ]
+        return invoke_chat_completion(client, model, messages, stream=False, temperature=0)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(questions))) as executor:
+        return list(executor.map(answer, questions))
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description="Direct OpenAI client for FastAPI proxy with Bearer token")
@@ -137,37 +133,59 @@ def main():
                         help="Question to ask the model")
     parser.add_argument("--system-prompt", default=DEFAULT_SYSTEM_PROMPT,
                        help="System prompt to use")
+    parser.add_argument("--questions-file",
+                        help="File with one question per line, answered concurrently instead of --question")
     parser.add_argument("--stream", action="store_true", help="Use streaming mode")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     args = parser.parse_args()
 
+    questions = None
+    if args.questions_file:
+        if args.stream:
+            parser.error("--stream cannot be combined with --questions-file")
+        with open(args.questions_file, encoding="utf-8") as questions_file:
+            questions = [line.strip() for line in questions_file if line.strip()]
+        if not questions:
+            parser.error(f"No question found in {args.questions_file}")
+
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
     print(f"Script will use the model: {args.model}")
-    print(f"Script will answer to the question: {args.question}")
+    if questions:
+        print(f"Script will answer {len(questions)} questions from: {args.questions_file}")
+    else:
+        print(f"Script will answer to the question: {args.question}")
     print(f"Streaming mode: {'enabled' if args.stream else 'disabled'}")
 
-    # Get access token
-    token_data = get_access_token("admin_user", "admin123")
-    if token_data is None:
-        print("Failed to get access token. Exiting.")
-        return 1
-
-    access_token = token_data["access_token"]
-
-    # Initialize OpenAI client with our proxy
-    base_url = "http://localhost:8000/v1"
-    client = create_openai_client(base_url, access_token)
-
-    # Prepare messages
-    messages = [
-        {"role": "system", "content": args.system_prompt},
-        {"role": "user", "content": args.question}
-    ]
-
     try:
-        if args.stream:
+        # Get access token
+        with requests.Session() as session:
+            token_data = get_access_token(session, "admin_user", "admin123")
+        if token_data is None:
+            print("Failed to get access token. Exiting.")
+            return 1
+
+        access_token = token_data["access_token"]
+
+        # Initialize OpenAI client with our proxy
+        base_url = "http://localhost:8000/v1"
+        client = create_openai_client(base_url, access_token)
+
+        # Prepare messages
+        messages = [
+            {"role": "system", "content": args.system_prompt},
+            {"role": "user", "content": args.question}
+        ]
+
+        if questions:
+            answers = answer_questions(client, args.model, args.system_prompt, questions)
+            for question, answer in zip(questions, answers):
+                print(f"\nQuestion: {question}\n" + "-" * 50)
+                print(answer)
+                print("-" * 50)
+
+        elif args.stream:
             # Process streaming response
             print("\nStreaming response:\n" + "-" * 50)
             stream = invoke_chat_completion(client, args.model, messages, stream=True, temperature=0)
@@ -175,24 +193,47 @@ def main():
             # Track streaming statistics
             chunk_count = 0
             start_time = time.time()
-            full_response = ""
+            response_parts = []
+
+            # Print chunks in small batches rather than flushing each token
+            pending = []
+            pending_size = 0
+            # Bound once, these run for every chunk of the stream
+            write, flush, monotonic = sys.stdout.write, sys.stdout.flush, time.monotonic
+            verbose = args.verbose
+            last_flush = monotonic()
+
+            def flush_pending():
+                nonlocal pending_size, last_flush
+                write("".join(pending))
+                flush()
+                pending.clear()
+                pending_size = 0
+                last_flush = monotonic()
 
-            # Print each chunk as it arrives
             for chunk in stream:
                 chunk_count += 1
                 # print(chunk)
-                if chunk.choices and chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    full_response += content
-                    print(content, end="", flush=True)
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    response_parts.append(content)
+                    pending.append(content)
+                    pending_size += len(content)
+                    if (pending_size >= STREAM_FLUSH_CHARS
+                            or monotonic() - last_flush >= STREAM_FLUSH_INTERVAL):
+                        flush_pending()
 
                     # Print statistics every 20 chunks
-                    if chunk_count % 20 == 0 and args.verbose:
+                    if verbose and chunk_count % 20 == 0:
+                        flush_pending()
                         elapsed = time.time() - start_time
                         print(f"\n[INFO] Received {chunk_count} chunks in {elapsed:.2f}s", end="", flush=True)
 
+            flush_pending()
+
             # Final statistics
             total_time = time.time() - start_time
+            full_response = "".join(response_parts)
             print("\n" + "-" * 50)
             print(f"\nTotal chunks: {chunk_count}")
             print(f"Total time: {total_time:.2f}s")
@@ -205,8 +246,12 @@ def main():
             print(response)
             print("-" * 50)
 
+    except requests.RequestException:
+        # Only the Keycloak token request goes through requests, its error is already logged
+        print("Failed to get access token. Exiting.")
+        return 1
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return 1
 
     return 0
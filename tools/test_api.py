@@ -1,5 +1,7 @@
 """Test script to verify API functionality with generated API key."""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
 import sys
@@ -9,24 +11,40 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 BASE_URL = "http://localhost:8000/v1"
+RETRY_STATUS_CODES = (429, 502, 503, 504)
 
-def test_api_key(api_key: str):
-    """Test API endpoints with the provided API key.
+def create_session(api_key: str) -> requests.Session:
+    """Create an HTTP session authenticated with an API key.
 
     Args:
-        api_key (str): API key to test
+        api_key (str): API key sent as bearer token
+
+    Returns:
+        requests.Session: Session with a pooled, retrying adapter
     """
-    headers = {
+    session = requests.Session()
+    session.headers.update({
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json"
-    }
+    })
+    retries = Retry(total=2, backoff_factor=0.2, status_forcelist=RETRY_STATUS_CODES, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_api_key(session: requests.Session):
+    """Test API endpoints with an authenticated session.
 
+    Args:
+        session (requests.Session): Session carrying the API key to test
+    """
     logger.info("🔍 Testing API endpoints...")
 
     # Test 1: Get users
     try:
         logger.info("Testing GET /admin/users/")
-        response = requests.get(f"{BASE_URL}/admin/users/", headers=headers)
+        response = session.get(f"{BASE_URL}/admin/users/")
         if response.status_code == 200:
             users = response.json()
             logger.info(f"✅ GET /admin/users/ - Found {len(users)} users")
@@ -38,7 +56,7 @@ def test_api_key(api_key: str):
     # Test 2: Get groups
     try:
         logger.info("Testing GET /admin/groups/")
-        response = requests.get(f"{BASE_URL}/admin/groups/", headers=headers)
+        response = session.get(f"{BASE_URL}/admin/groups/")
         if response.status_code == 200:
             groups = response.json()
             logger.info(f"✅ GET /admin/groups/ - Found {len(groups)} groups")
@@ -50,7 +68,7 @@ def test_api_key(api_key: str):
     # Test 3: Get user statistics
     try:
         logger.info("Testing GET /admin/users/statistics")
-        response = requests.get(f"{BASE_URL}/admin/users/statistics", headers=headers)
+        response = session.get(f"{BASE_URL}/admin/users/statistics")
         if response.status_code == 200:
             stats = response.json()
             logger.info(f"✅ GET /admin/users/statistics - {stats}")
@@ -69,7 +87,8 @@ def main():
     api_key = sys.argv[1]
     logger.info(f"Testing with API key: {api_key[:10]}...")
 
-    test_api_key(api_key)
+    with create_session(api_key) as session:
+        test_api_key(session)
 
     logger.info("\n🎉 API testing completed!")
 
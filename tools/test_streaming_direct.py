@@ -8,9 +8,12 @@ import argparse
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import time
-from typing import Dict, Any, Optional, Generator, List
+from typing import Callable, Dict, Any, Optional, Generator, Iterator, List, Tuple
+
+import keycloak_token_cache
 
 # Configuration du logging
 logging.basicConfig(
@@ -20,16 +23,36 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Configuration
-KEYCLOAK_URL = "http://localhost:8080"
-REALM_NAME = "fastapi-openai-rag"
-CLIENT_ID = "fastapi-app"
-CLIENT_SECRET = "fastapi-secret-key"
 API_BASE_URL = "http://localhost:8000/v1"
+CHAT_COMPLETIONS_URL = f"{API_BASE_URL}/chat/completions"
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Pas de compression sur le flux, les chunks sont traités dès réception
+STREAM_HEADERS = {**JSON_HEADERS, "Accept-Encoding": "identity"}
+# Le contenu streamé est écrit par lots de ce nombre de chunks, ou après ce délai
+STREAM_FLUSH_CHUNKS = 8
+STREAM_FLUSH_INTERVAL = 0.016
+
+def create_session() -> requests.Session:
+    """Crée une session HTTP réutilisée pour le token et les complétions.
 
-def get_access_token(username: str, password: str) -> Optional[str]:
+    Returns:
+        requests.Session: Session avec un pool de connexions keep-alive
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "openai-proxy-streaming-test/1.0"})
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_access_token(session: requests.Session, username: str, password: str) -> Optional[str]:
     """Récupère un token d'accès depuis Keycloak.
 
+    Le token est partagé avec les scripts openai/langchain via le cache
+    disque de keycloak_token_cache.
+
     Args:
+        session (requests.Session): Session HTTP utilisée pour la requête
         username (str): Nom d'utilisateur
         password (str): Mot de passe
 
@@ -37,90 +60,132 @@ def get_access_token(username: str, password: str) -> Optional[str]:
         Optional[str]: Token d'accès ou None si échec
     """
     try:
-        logger.info(f"Récupération du token d'accès pour l'utilisateur: {username}")
-
-        data = {
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "grant_type": "password",
-            "username": username,
-            "password": password
-        }
-
-        response = requests.post(
-            f"{KEYCLOAK_URL}/realms/{REALM_NAME}/protocol/openid-connect/token",
-            data=data
-        )
-
-        if response.status_code == 200:
-            token_data = response.json()
-            access_token = token_data.get("access_token")
-            logger.info("✅ Token d'accès obtenu avec succès")
-            return access_token
-        else:
-            logger.error(f"❌ Échec de récupération du token: {response.status_code} - {response.text}")
-            return None
-
+        token_data = keycloak_token_cache.get_access_token(session, username, password)
     except Exception as e:
-        logger.error(f"❌ Erreur lors de la récupération du token: {e}")
+        logger.error("❌ Erreur lors de la récupération du token: %s", e)
         return None
+    return token_data.get("access_token") if token_data else None
 
-def create_chat_completion_stream(model: str, messages: List[Dict[str, str]], access_token: str) -> Generator[Dict[str, Any], None, None]:
-    """Crée une complétion de chat en mode streaming.
+def iter_sse_lines(response: requests.Response,
+                   on_block_end: Optional[Callable[[], None]] = None) -> Iterator[bytearray]:
+    """Découpe le flux SSE en lignes d'octets, sans décodage intermédiaire.
+
+    Un seul tampon est réutilisé pour tout le flux, chaque ligne n'est copiée
+    qu'une fois.
+
+    Args:
+        response (requests.Response): Réponse ouverte en mode stream
+        on_block_end (Optional[Callable[[], None]]): Appelé une fois les lignes
+            d'un bloc réseau consommées, avant d'attendre le bloc suivant
+
+    Yields:
+        Iterator[bytearray]: Lignes non vides, sans le séparateur de fin de ligne
+    """
+    buffer = bytearray()
+    for block in response.iter_content(chunk_size=None):
+        buffer.extend(block)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end  # '\r'
+            if line_end > start:
+                yield buffer[start:line_end]
+            start = end + 1
+        del buffer[:start]
+        if on_block_end is not None:
+            on_block_end()
+
+    if buffer.strip():
+        yield buffer.rstrip(b"\r")
+
+def build_request(model: str, messages: List[Dict[str, str]], access_token: str, stream: bool) -> Tuple[Dict[str, str], bytes]:
+    """Prépare les en-têtes et le corps sérialisé d'une complétion de chat.
 
     Args:
         model (str): Nom du modèle
         messages (list): Liste des messages
         access_token (str): Token d'authentification
+        stream (bool): Mode streaming ou non
 
-    Yields:
-        Generator[Dict[str, Any], None, None]: Générateur des chunks de réponse
+    Returns:
+        Tuple[Dict[str, str], bytes]: En-têtes et corps JSON de la requête
     """
-    url = f"{API_BASE_URL}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
+    base_headers = STREAM_HEADERS if stream else JSON_HEADERS
+    headers = {**base_headers, "Authorization": f"Bearer {access_token}"}
 
     payload = {
         "model": model,
         "messages": messages,
-        "stream": True,
+        "stream": stream,
         "temperature": 0.7,
     }
 
-    logger.debug(f"Envoi de la requête à {url}")
-    logger.debug(f"Payload: {json.dumps(payload)}")
+    logger.debug("Envoi de la requête à %s", CHAT_COMPLETIONS_URL)
+    # Sérialiser une seule fois, le même corps sert à l'envoi et au log
+    body = json.dumps(payload).encode("utf-8")
+    logger.debug("Payload: %s", body)
+    return headers, body
+
+def create_chat_completion_stream(session: requests.Session, model: str, messages: List[Dict[str, str]], access_token: str) -> Generator[Dict[str, Any], None, None]:
+    """Crée une complétion de chat en mode streaming.
+
+    Args:
+        session (requests.Session): Session HTTP utilisée pour la requête
+        model (str): Nom du modèle
+        messages (list): Liste des messages
+        access_token (str): Token d'authentification
+
+    Yields:
+        Generator[Dict[str, Any], None, None]: Générateur des chunks de réponse
+    """
+    headers, body = build_request(model, messages, access_token, stream=True)
 
     try:
         # Utiliser la bibliothèque requests pour le streaming
-        response = requests.post(url, json=payload, headers=headers, stream=True)
+        response = session.post(CHAT_COMPLETIONS_URL, data=body, headers=headers, stream=True)
         response.raise_for_status()  # Lever une exception pour les erreurs HTTP
 
-        logger.debug(f"Connexion établie. Status code: {response.status_code}")
-        logger.debug(f"Headers: {response.headers}")
+        logger.debug("Connexion établie. Status code: %s", response.status_code)
+        logger.debug("Headers: %s", response.headers)
 
         # Variables pour suivre les chunks reçus
         chunk_count = 0
-        start_time = time.time()
-        content_received = ""
-
-        # Traiter chaque ligne de la réponse
-        for line in response.iter_lines():
-            if not line:
+        start_time = time.perf_counter()
+        content_parts: List[str] = []
+
+        # Écrire la sortie par petits lots plutôt qu'un flush par token
+        pending: List[str] = []
+        last_flush = time.monotonic()
+
+        def flush_pending() -> None:
+            nonlocal last_flush
+            if not pending:
+                return
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            pending.clear()
+            last_flush = time.monotonic()
+
+        # Évalué une fois, évite le découpage de chaque ligne hors mode debug
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Traiter chaque ligne de la réponse; le reste du lot est écrit avant
+        # d'attendre le bloc réseau suivant, un flux bloqué ne retient rien
+        for line in iter_sse_lines(response, on_block_end=flush_pending):
+            # Ignorer les commentaires SSE (keep-alive ": ping")
+            if line.startswith(b":"):
                 continue
-
-            line = line.decode('utf-8')
             chunk_count += 1
 
-            logger.debug(f"Chunk {chunk_count} reçu: {line[:100]}...")
+            if debug_enabled:
+                logger.debug("Chunk %s reçu: %s...", chunk_count, line[:100])
 
-            # Traiter les chunks SSE
-            if line.startswith("data: "):
+            # Traiter les chunks SSE, json.loads accepte directement les octets
+            if line.startswith(b"data: "):
                 data = line[6:]  # Enlever le préfixe "data: "
 
                 # Détecter la fin du flux
-                if data == "[DONE]":
+                if data == b"[DONE]":
+                    flush_pending()
                     logger.info("Fin du flux de données ([DONE] reçu)")
                     break
 
@@ -128,33 +193,40 @@ def create_chat_completion_stream(model: str, messages: List[Dict[str, str]], ac
                     json_data = json.loads(data)
 
                     # Extraire le contenu du chunk (pour l'affichage progressif)
-                    if "choices" in json_data and json_data["choices"]:
-                        if "content" in json_data["choices"][0].get("delta", {}):
-                            content = json_data["choices"][0]["delta"]["content"]
-                            content_received += content
-                            print(content, end="", flush=True)
-                        elif "content" in json_data["choices"][0].get("message", {}):
-                            content = json_data["choices"][0]["message"]["content"] or ""
-                            content_received += content
-                            print(content, end="", flush=True)
+                    choices = json_data.get("choices")
+                    if choices:
+                        choice = choices[0]
+                        delta = choice.get("delta")
+                        message = choice.get("message")
+                        content = (delta and delta.get("content")) or (message and message.get("content"))
+                        if content:
+                            content_parts.append(content)
+                            pending.append(content)
+                            if (len(pending) >= STREAM_FLUSH_CHUNKS
+                                    or time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL):
+                                flush_pending()
 
                     yield json_data
                 except json.JSONDecodeError:
-                    logger.warning(f"Impossible de décoder le JSON: {data}")
+                    logger.warning("Impossible de décoder le JSON: %s", data)
+
+        flush_pending()
 
         # Afficher le résumé
-        elapsed = time.time() - start_time
-        logger.info(f"\n\nRésumé: {chunk_count} chunks reçus en {elapsed:.2f} secondes")
-        logger.info(f"Contenu total reçu: {len(content_received)} caractères")
+        elapsed = time.perf_counter() - start_time
+        logger.info("\n\nRésumé: %s chunks reçus en %.2f secondes", chunk_count, elapsed)
+        content_received = "".join(content_parts)
+        logger.info("Contenu total reçu: %s caractères", len(content_received))
 
     except requests.RequestException as e:
-        logger.error(f"Erreur lors de la requête: {e}")
+        logger.error("Erreur lors de la requête: %s", e)
         raise
 
-def create_chat_completion_normal(model: str, messages: List[Dict[str, str]], access_token: str) -> Dict[str, Any]:
+def create_chat_completion_normal(session: requests.Session, model: str, messages: List[Dict[str, str]], access_token: str) -> Dict[str, Any]:
     """Crée une complétion de chat en mode normal (non-streaming).
 
     Args:
+        session (requests.Session): Session HTTP utilisée pour la requête
         model (str): Nom du modèle
         messages (list): Liste des messages
         access_token (str): Token d'authentification
@@ -162,27 +234,13 @@ def create_chat_completion_normal(model: str, messages: List[Dict[str, str]], ac
     Returns:
         Dict[str, Any]: Réponse complète
     """
-    url = f"{API_BASE_URL}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "model": model,
-        "messages": messages,
-        "stream": False,
-        "temperature": 0.7,
-    }
-
-    logger.debug(f"Envoi de la requête à {url}")
-    logger.debug(f"Payload: {json.dumps(payload)}")
+    headers, body = build_request(model, messages, access_token, stream=False)
 
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = session.post(CHAT_COMPLETIONS_URL, data=body, headers=headers)
         response.raise_for_status()
 
-        logger.debug(f"Réponse reçue. Status code: {response.status_code}")
+        logger.debug("Réponse reçue. Status code: %s", response.status_code)
 
         json_response = response.json()
 
@@ -194,7 +252,7 @@ def create_chat_completion_normal(model: str, messages: List[Dict[str, str]], ac
         return json_response
 
     except requests.RequestException as e:
-        logger.error(f"Erreur lors de la requête: {e}")
+        logger.error("Erreur lors de la requête: %s", e)
         raise
 
 def main():
@@ -220,8 +278,21 @@ def main():
     print(f"Mode streaming: {'activé' if args.stream else 'désactivé'}")
     print("-" * 50)
 
+    with create_session() as session:
+        return run_test(session, args)
+
+def run_test(session: requests.Session, args: argparse.Namespace) -> int:
+    """Exécute le test avec une session HTTP partagée.
+
+    Args:
+        session (requests.Session): Session HTTP réutilisée par tous les appels
+        args (argparse.Namespace): Arguments de la ligne de commande
+
+    Returns:
+        int: Code de sortie
+    """
     # Obtenir le token d'accès
-    access_token = get_access_token(args.username, args.password)
+    access_token = get_access_token(session, args.username, args.password)
     if not access_token:
         logger.error("Impossible de continuer sans token d'accès")
         return 1
@@ -235,16 +306,16 @@ def main():
     try:
         if args.stream:
             print("Mode streaming activé, réponse en temps réel:\n")
-            # Collecter les réponses du flux (mais l'affichage se fait dans la fonction)
-            chunks = list(create_chat_completion_stream(args.model, messages, access_token))
-            print(f"\n\nNombre de chunks reçus: {len(chunks)}")
+            # Compter les chunks du flux sans les conserver (l'affichage se fait dans la fonction)
+            chunk_count = sum(1 for _ in create_chat_completion_stream(session, args.model, messages, access_token))
+            print(f"\n\nNombre de chunks reçus: {chunk_count}")
         else:
             print("Mode normal (non-streaming):\n")
-            response = create_chat_completion_normal(args.model, messages, access_token)
+            response = create_chat_completion_normal(session, args.model, messages, access_token)
             print(f"\nRéponse complète reçue")
 
     except Exception as e:
-        logger.error(f"Erreur lors de l'exécution: {e}")
+        logger.error("Erreur lors de l'exécution: %s", e)
         return 1
 
     return 0